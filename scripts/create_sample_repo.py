@@ -11,43 +11,17 @@ This script creates a repository with:
 
 import os
 import subprocess
+import sys
 import tempfile
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Dict, Iterator, List, Optional
 
+_GIT_CONFIG_USER = b"[user]\n\tname = Test User\n\temail = test@example.com\n"
 
-def run_git_command(command: List[str], cwd: str) -> None:
-    """Run a git command in the specified directory."""
-    try:
-        subprocess.run(command, cwd=cwd, check=True, capture_output=True, text=True)
-        print(f"✓ {' '.join(command)}")
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Error running {' '.join(command)}: {e.stderr}")
-        raise
-
-
-def create_file_with_content(repo_path: str, filename: str, content: str) -> None:
-    """Create a file with specific content."""
-    file_path = Path(repo_path) / filename
-    file_path.write_text(content)
-    print(f"Created {filename}")
-
-
-def create_sample_repo(repo_path: str) -> None:
-    """Create a sample Git repository with branches and commits."""
-    print(f"Creating sample repository at: {repo_path}")
-
-    # Initialize the repository
-    run_git_command(["git", "init"], repo_path)
-    run_git_command(["git", "config", "user.name", "Test User"], repo_path)
-    run_git_command(["git", "config", "user.email", "test@example.com"], repo_path)
-
-    # Create initial files on main branch
-    print("\n=== Setting up main branch ===")
-    create_file_with_content(
-        repo_path,
-        "README.md",
-        """# Sample Project
+# Sample file contents, kept as bytes so they are written without re-encoding
+_FILE_README: bytes = b"""# Sample Project
 
 This is a sample project for testing git-taz.
 
@@ -57,13 +31,9 @@ This is a sample project for testing git-taz.
 - Data processing
 - API endpoints
 - Dashboard UI
-""",
-    )
+"""
 
-    create_file_with_content(
-        repo_path,
-        "main.py",
-        """#!/usr/bin/env python3
+_FILE_MAIN: bytes = b"""#!/usr/bin/env python3
 \"\"\"Main application entry point.\"\"\"
 
 def main():
@@ -71,29 +41,13 @@ def main():
     
 if __name__ == "__main__":
     main()
-""",
-    )
+"""
 
-    create_file_with_content(
-        repo_path,
-        "requirements.txt",
-        """requests>=2.25.0
+_FILE_REQUIREMENTS: bytes = b"""requests>=2.25.0
 flask>=2.0.0
-""",
-    )
-
-    # Initial commit
-    run_git_command(["git", "add", "."], repo_path)
-    run_git_command(
-        ["git", "commit", "-m", "Initial commit: Basic project structure"], repo_path
-    )
+"""
 
-    # Add authentication feature
-    print("\n=== Adding authentication feature ===")
-    create_file_with_content(
-        repo_path,
-        "auth.py",
-        """\"\"\"Authentication module.\"\"\"
+_FILE_AUTH: bytes = b"""\"\"\"Authentication module.\"\"\"
 
 class AuthManager:
     def __init__(self):
@@ -105,14 +59,9 @@ class AuthManager:
     def register(self, username, password):
         self.users[username] = password
         return True
-""",
-    )
+"""
 
-    # Update main.py to include auth
-    create_file_with_content(
-        repo_path,
-        "main.py",
-        """#!/usr/bin/env python3
+_FILE_MAIN_WITH_AUTH: bytes = b"""#!/usr/bin/env python3
 \"\"\"Main application entry point.\"\"\"
 
 from auth import AuthManager
@@ -124,20 +73,9 @@ def main():
     
 if __name__ == "__main__":
     main()
-""",
-    )
-
-    run_git_command(["git", "add", "."], repo_path)
-    run_git_command(
-        ["git", "commit", "-m", "feat: Add user authentication system"], repo_path
-    )
+"""
 
-    # Add data processing feature
-    print("\n=== Adding data processing feature ===")
-    create_file_with_content(
-        repo_path,
-        "data_processor.py",
-        """\"\"\"Data processing utilities.\"\"\"
+_FILE_DATA_PROCESSOR: bytes = b"""\"\"\"Data processing utilities.\"\"\"
 
 import json
 from typing import Dict, List, Any
@@ -158,20 +96,9 @@ class DataProcessor:
     def save_data(self, filename: str, data: List[Dict[str, Any]]) -> None:
         with open(filename, 'w') as f:
             json.dump(data, f, indent=2)
-""",
-    )
-
-    run_git_command(["git", "add", "data_processor.py"], repo_path)
-    run_git_command(
-        ["git", "commit", "-m", "feat: Add data processing capabilities"], repo_path
-    )
+"""
 
-    # Add API endpoints
-    print("\n=== Adding API endpoints ===")
-    create_file_with_content(
-        repo_path,
-        "api.py",
-        """\"\"\"REST API endpoints.\"\"\"
+_FILE_API: bytes = b"""\"\"\"REST API endpoints.\"\"\"
 
 from flask import Flask, jsonify, request
 from auth import AuthManager
@@ -198,20 +125,9 @@ def health_check():
 
 if __name__ == '__main__':
     app.run(debug=True)
-""",
-    )
-
-    run_git_command(["git", "add", "api.py"], repo_path)
-    run_git_command(["git", "commit", "-m", "feat: Add REST API endpoints"], repo_path)
-
-    # Create feature branch: dashboard-ui
-    print("\n=== Creating feature/dashboard-ui branch ===")
-    run_git_command(["git", "checkout", "-b", "feature/dashboard-ui"], repo_path)
+"""
 
-    create_file_with_content(
-        repo_path,
-        "dashboard.py",
-        """\"\"\"Web dashboard interface.\"\"\"
+_FILE_DASHBOARD: bytes = b"""\"\"\"Web dashboard interface.\"\"\"
 
 from flask import Flask, render_template_string
 from api import app
@@ -245,24 +161,9 @@ DASHBOARD_TEMPLATE = '''
 @app.route('/dashboard')
 def dashboard():
     return render_template_string(DASHBOARD_TEMPLATE)
-""",
-    )
-
-    run_git_command(["git", "add", "dashboard.py"], repo_path)
-    run_git_command(
-        ["git", "commit", "-m", "feat: Add web dashboard interface"], repo_path
-    )
-
-    # Create feature branch: advanced-auth
-    print("\n=== Creating feature/advanced-auth branch ===")
-    run_git_command(["git", "checkout", "main"], repo_path)
-    run_git_command(["git", "checkout", "-b", "feature/advanced-auth"], repo_path)
+"""
 
-    # Update auth.py with advanced features
-    create_file_with_content(
-        repo_path,
-        "auth.py",
-        """\"\"\"Advanced authentication module.\"\"\"
+_FILE_ADVANCED_AUTH: bytes = b"""\"\"\"Advanced authentication module.\"\"\"
 
 import hashlib
 import secrets
@@ -342,31 +243,9 @@ class AuthManager:
             del self.sessions[session_token]
             return True
         return False
-""",
-    )
-
-    run_git_command(["git", "add", "auth.py"], repo_path)
-    run_git_command(
-        [
-            "git",
-            "commit",
-            "-m",
-            "feat: Add advanced authentication with sessions and rate limiting",
-        ],
-        repo_path,
-    )
-
-    # Create feature branch: data-analytics (incomplete)
-    print("\n=== Creating feature/data-analytics branch (incomplete) ===")
-    run_git_command(["git", "checkout", "main"], repo_path)
-    # Go back to an earlier commit to simulate incomplete branch
-    run_git_command(["git", "checkout", "HEAD~2"], repo_path)  # Before API was added
-    run_git_command(["git", "checkout", "-b", "feature/data-analytics"], repo_path)
+"""
 
-    create_file_with_content(
-        repo_path,
-        "analytics.py",
-        """\"\"\"Data analytics module (work in progress).\"\"\"
+_FILE_ANALYTICS: bytes = b"""\"\"\"Data analytics module (work in progress).\"\"\"
 
 import statistics
 from typing import List, Dict, Any
@@ -390,59 +269,262 @@ class Analytics:
     # TODO: Add more advanced analytics
     # TODO: Add visualization capabilities
     # TODO: Add export functionality
-""",
-    )
+"""
 
-    run_git_command(["git", "add", "analytics.py"], repo_path)
-    run_git_command(
-        ["git", "commit", "-m", "wip: Start data analytics module (incomplete)"],
-        repo_path,
-    )
 
-    # Create version branches
-    print("\n=== Creating version branches ===")
+def run_git_command(command: List[str], cwd: str) -> None:
+    """Run a git command in the specified directory."""
+    try:
+        # Only stderr is ever reported, so stdout is discarded
+        subprocess.run(
+            command,
+            cwd=cwd,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        print(f"✓ {' '.join(command)}")
+    except subprocess.CalledProcessError as e:
+        print(f"✗ Error running {' '.join(command)}: {e.stderr}")
+        raise
 
-    # v1.0.0 - Basic version
-    run_git_command(["git", "checkout", "main"], repo_path)
-    run_git_command(["git", "checkout", "HEAD~2"], repo_path)  # Before API was added
-    run_git_command(["git", "checkout", "-b", "release/v1.0.0"], repo_path)
 
-    create_file_with_content(repo_path, "VERSION", "1.0.0")
-    run_git_command(["git", "add", "VERSION"], repo_path)
-    run_git_command(
-        ["git", "commit", "-m", "release: v1.0.0 - Basic functionality with auth"],
-        repo_path,
-    )
-    run_git_command(["git", "tag", "v1.0.0"], repo_path)
-
-    # v1.1.0 - With data processing
-    run_git_command(["git", "checkout", "main"], repo_path)
-    run_git_command(["git", "checkout", "HEAD~1"], repo_path)  # Before API was added
-    run_git_command(["git", "checkout", "-b", "release/v1.1.0"], repo_path)
-
-    create_file_with_content(repo_path, "VERSION", "1.1.0")
-    run_git_command(["git", "add", "VERSION"], repo_path)
-    run_git_command(
-        ["git", "commit", "-m", "release: v1.1.0 - Add data processing capabilities"],
-        repo_path,
+def write_git_config(config_path: Path) -> None:
+    """Append the sample user identity to the repository config."""
+    # A single small write needs no buffered file object
+    fd = os.open(config_path, os.O_WRONLY | os.O_APPEND)
+    try:
+        os.write(fd, _GIT_CONFIG_USER)
+    finally:
+        os.close(fd)
+
+
+class FastImportStream:
+    """Writes the sample history as ``git fast-import`` commands to ``sink``."""
+
+    COMMITTER = b"Test User <test@example.com>"
+
+    def __init__(self, sink: BinaryIO) -> None:
+        self._sink = sink
+        self._last_mark = 0
+        self._timestamp = int(time.time())
+
+    def _next_mark(self) -> int:
+        self._last_mark += 1
+        return self._last_mark
+
+    def _emit_data(self, payload: bytes) -> None:
+        self._sink.write(b"data %d\n" % len(payload))
+        self._sink.write(payload)
+        self._sink.write(b"\n")
+
+    def emit_blob(self, content: bytes) -> int:
+        """Add a file blob and return its mark."""
+        mark = self._next_mark()
+        self._sink.write(b"blob\nmark :%d\n" % mark)
+        self._emit_data(content)
+        return mark
+
+    def emit_commit(
+        self,
+        branch: str,
+        message: str,
+        parent_mark: Optional[int],
+        file_marks: Dict[str, int],
+    ) -> int:
+        """Add a commit on ``branch`` changing ``file_marks`` and return its mark.
+
+        Only the files touched by the commit are listed; everything else is
+        inherited from ``parent_mark``, so no step rescans the whole tree.
+        """
+        mark = self._next_mark()
+        # Space the commits out so log ordering matches creation order
+        self._timestamp += 1
+        self._sink.write(b"commit refs/heads/%s\nmark :%d\n" % (branch.encode(), mark))
+        self._sink.write(b"committer %s %d +0000\n" % (self.COMMITTER, self._timestamp))
+        self._emit_data(message.encode())
+        if parent_mark is not None:
+            self._sink.write(b"from :%d\n" % parent_mark)
+        for filename, blob_mark in file_marks.items():
+            self._sink.write(b"M 100644 :%d %s\n" % (blob_mark, filename.encode()))
+        self._sink.write(b"\n")
+        print(f"✓ [{branch}] {message}")
+        return mark
+
+    def emit_reset(self, ref: str, from_mark: int) -> None:
+        """Point ``ref`` at the commit identified by ``from_mark``."""
+        self._sink.write(b"reset %s\nfrom :%d\n\n" % (ref.encode(), from_mark))
+
+    def emit_tag(self, name: str, from_mark: int) -> None:
+        """Add a lightweight tag pointing at ``from_mark``."""
+        self.emit_reset(f"refs/tags/{name}", from_mark)
+        print(f"✓ Tagged {name}")
+
+
+@contextmanager
+def fast_import(repo_path: str) -> Iterator[FastImportStream]:
+    """Stream commands into a single ``git fast-import`` process.
+
+    git starts importing while the rest of the history is still being
+    generated, instead of waiting for one fully built buffer. Blobs, trees
+    and commits all go through this one process, so there is no per-file
+    ``hash-object`` or ``update-index`` round trip, and the larger pipe
+    buffer batches many small commands into each write.
+    """
+    command = ["git", "fast-import", "--quiet"]
+    process = subprocess.Popen(
+        command,
+        bufsize=1 << 16,
+        cwd=repo_path,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
     )
-    run_git_command(["git", "tag", "v1.1.0"], repo_path)
+    assert process.stdin is not None
+    try:
+        yield FastImportStream(process.stdin)
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    _, stderr = process.communicate()
+    if process.returncode:
+        print(f"✗ Error running {' '.join(command)}: {stderr.decode()}")
+        raise subprocess.CalledProcessError(process.returncode, command, stderr=stderr)
+    print(f"✓ {' '.join(command)}")
 
-    # v2.0.0 - Latest with API
-    run_git_command(["git", "checkout", "main"], repo_path)
-    run_git_command(["git", "checkout", "-b", "release/v2.0.0"], repo_path)
 
-    create_file_with_content(repo_path, "VERSION", "2.0.0")
-    run_git_command(["git", "add", "VERSION"], repo_path)
-    run_git_command(
-        ["git", "commit", "-m", "release: v2.0.0 - Full API support"], repo_path
+def create_sample_repo(repo_path: str) -> None:
+    """Create a sample Git repository with branches and commits."""
+    print(f"Creating sample repository at: {repo_path}")
+    repo = Path(repo_path)
+
+    # Only three git processes run in total: init, fast-import and reset
+    run_git_command(["git", "init", "--quiet", "--initial-branch=main"], repo_path)
+    write_git_config(repo / ".git" / "config")
+
+    with fast_import(repo_path) as stream:
+        # Create initial files on main branch
+        print("\n=== Setting up main branch ===")
+        initial = stream.emit_commit(
+            "main",
+            "Initial commit: Basic project structure",
+            None,
+            {
+                "README.md": stream.emit_blob(_FILE_README),
+                "main.py": stream.emit_blob(_FILE_MAIN),
+                "requirements.txt": stream.emit_blob(_FILE_REQUIREMENTS),
+            },
+        )
+
+        # Add authentication feature
+        print("\n=== Adding authentication feature ===")
+        auth = stream.emit_commit(
+            "main",
+            "feat: Add user authentication system",
+            initial,
+            {
+                "auth.py": stream.emit_blob(_FILE_AUTH),
+                # Update main.py to include auth
+                "main.py": stream.emit_blob(_FILE_MAIN_WITH_AUTH),
+            },
+        )
+
+        # Add data processing feature
+        print("\n=== Adding data processing feature ===")
+        data_processing = stream.emit_commit(
+            "main",
+            "feat: Add data processing capabilities",
+            auth,
+            {
+                "data_processor.py": stream.emit_blob(_FILE_DATA_PROCESSOR),
+            },
+        )
+
+        # Add API endpoints
+        print("\n=== Adding API endpoints ===")
+        api = stream.emit_commit(
+            "main",
+            "feat: Add REST API endpoints",
+            data_processing,
+            {
+                "api.py": stream.emit_blob(_FILE_API),
+            },
+        )
+
+        # Create feature branch: dashboard-ui
+        print("\n=== Creating feature/dashboard-ui branch ===")
+        stream.emit_commit(
+            "feature/dashboard-ui",
+            "feat: Add web dashboard interface",
+            api,
+            {
+                "dashboard.py": stream.emit_blob(_FILE_DASHBOARD),
+            },
+        )
+
+        # Create feature branch: advanced-auth
+        print("\n=== Creating feature/advanced-auth branch ===")
+        stream.emit_commit(
+            "feature/advanced-auth",
+            "feat: Add advanced authentication with sessions and rate limiting",
+            api,
+            {
+                # Update auth.py with advanced features
+                "auth.py": stream.emit_blob(_FILE_ADVANCED_AUTH),
+            },
+        )
+
+        # Create feature branch: data-analytics (incomplete)
+        print("\n=== Creating feature/data-analytics branch (incomplete) ===")
+        # Branch from an earlier commit to simulate incomplete branch
+        stream.emit_commit(
+            "feature/data-analytics",
+            "wip: Start data analytics module (incomplete)",
+            auth,
+            {
+                "analytics.py": stream.emit_blob(_FILE_ANALYTICS),
+            },
+        )
+
+        # Create version branches
+        print("\n=== Creating version branches ===")
+
+        # v1.0.0 - Basic version
+        release = stream.emit_commit(
+            "release/v1.0.0",
+            "release: v1.0.0 - Basic functionality with auth",
+            auth,
+            {"VERSION": stream.emit_blob(b"1.0.0")},
+        )
+        stream.emit_tag("v1.0.0", release)
+
+        # v1.1.0 - With data processing
+        release = stream.emit_commit(
+            "release/v1.1.0",
+            "release: v1.1.0 - Add data processing capabilities",
+            data_processing,
+            {"VERSION": stream.emit_blob(b"1.1.0")},
+        )
+        stream.emit_tag("v1.1.0", release)
+
+        # v2.0.0 - Latest with API
+        release = stream.emit_commit(
+            "release/v2.0.0",
+            "release: v2.0.0 - Full API support",
+            api,
+            {"VERSION": stream.emit_blob(b"2.0.0")},
+        )
+        stream.emit_tag("v2.0.0", release)
+
+    # HEAD already points at main, so only the index and working tree are missing
+    run_git_command(["git", "reset", "--hard", "--quiet"], repo_path)
+
+    print(
+        "\n✅ Sample repository created successfully at: "
+        f"{os.path.abspath(repo_path)}"
     )
-    run_git_command(["git", "tag", "v2.0.0"], repo_path)
-
-    # Go back to main
-    run_git_command(["git", "checkout", "main"], repo_path)
-
-    print(f"\n✅ Sample repository created successfully at: {repo_path}")
     print("\nBranches created:")
     print("  - main (latest with all features)")
     print("  - feature/dashboard-ui (adds web dashboard)")
@@ -476,16 +558,25 @@ def main():
     if args.temp:
         repo_path = tempfile.mkdtemp(prefix="git-taz-sample-")
     else:
-        repo_path = os.path.abspath(args.path)
+        repo_path = args.path
 
         # Create directory if it doesn't exist
-        os.makedirs(repo_path, exist_ok=True)
-
+        try:
+            os.mkdir(repo_path)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            os.makedirs(repo_path, exist_ok=True)
+
+    # Progress lines are flushed once at the end instead of line by line
+    sys.stdout.reconfigure(line_buffering=False)
     try:
         create_sample_repo(repo_path)
     except Exception as e:
         print(f"\n❌ Error creating repository: {e}")
         return 1
+    finally:
+        sys.stdout.flush()
 
     return 0
 
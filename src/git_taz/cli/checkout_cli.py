@@ -5,12 +5,15 @@ from typing import Optional
 from ..models import GitRepository
 from ..services import GitOperationsService
 
+_TARGET_TYPE_MENU = "Select checkout target type:\n1. Branches\n2. Tags\n"
+
 
 class CheckoutCLI:
     """Command-line interface for checkout operations."""
 
     def __init__(self, repo_path: Optional[str] = None):
         try:
+            # from_path memoizes by absolute path, so repeat lookups are shared
             self.repository = GitRepository.from_path(repo_path or ".")
             self.git_operations = GitOperationsService(self.repository)
         except Exception as e:
@@ -22,24 +25,23 @@ class CheckoutCLI:
         branches = self.git_operations.get_branches()
         current = self.git_operations.get_current_branch()
 
-        print("Branches:")
-        for branch in branches:
-            marker = "* " if branch == current else "  "
-            print(f"{marker}{branch}")
+        lines = ["Branches:"]
+        lines += [
+            f"* {branch}" if branch == current else f"  {branch}" for branch in branches
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def list_tags(self) -> None:
         """List all tags."""
         tags = self.git_operations.get_tags()
 
-        print("Tags:")
-        for tag in tags:
-            print(f"  {tag}")
+        lines = ["Tags:"]
+        lines += [f"  {tag}" for tag in tags]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def checkout_interactive(self) -> None:
         """Interactive checkout selection."""
-        print("Select checkout target type:")
-        print("1. Branches")
-        print("2. Tags")
+        sys.stdout.write(_TARGET_TYPE_MENU)
 
         try:
             choice = input("Enter choice (1-2): ").strip()
@@ -58,22 +60,19 @@ class CheckoutCLI:
         """Show list and checkout selected target."""
         if target_type == "branches":
             targets = self.git_operations.get_branches()
-            print("\nAvailable branches:")
         else:
             targets = self.git_operations.get_tags()
-            print("\nAvailable tags:")
 
-        if not targets:
+        n = len(targets)
+        if not n:
             print(f"No {target_type} found.")
             return
 
-        for i, target in enumerate(targets, 1):
-            print(f"{i}. {target}")
+        listing = "\n".join(f"{i}. {target}" for i, target in enumerate(targets, 1))
+        sys.stdout.write(f"\nAvailable {target_type}:\n{listing}\n")
 
         try:
-            choice = input(
-                f"\nEnter number (1-{len(targets)}) or 'q' to quit: "
-            ).strip()
+            choice = input(f"\nEnter number (1-{n}) or 'q' to quit: ").strip()
         except KeyboardInterrupt:
             print("\nCancelled.")
             return
@@ -83,7 +82,7 @@ class CheckoutCLI:
 
         try:
             index = int(choice) - 1
-            if 0 <= index < len(targets):
+            if 0 <= index < n:
                 target = targets[index]
                 result = self.git_operations.checkout(target)
                 print(result.message)
@@ -1,14 +1,22 @@
 """Main module for git-taz functionality."""
 
-import argparse
+import functools
+import sys
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import argparse
 
-def parse_arguments() -> argparse.Namespace:
-    """Parse command line arguments.
+
+@functools.cache
+def _build_parser() -> "argparse.ArgumentParser":
+    """Build the command line parser once per process.
 
     Returns:
-        Parsed arguments namespace.
+        Configured argument parser.
     """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Git-taz: A Git utility tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -54,18 +62,34 @@ Examples:
         "--list-tags", action="store_true", help="List all tags"
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments() -> "argparse.Namespace":
+    """Parse command line arguments.
+
+    Returns:
+        Parsed arguments namespace.
+    """
+    return _build_parser().parse_args()
 
 
 def main() -> None:
     """Main entry point for the application."""
+    # Launching the UI with no arguments is the common case; skip argparse
+    if len(sys.argv) == 1:
+        from .ui import run_ui
+
+        run_ui(None)
+        return
+
     args = parse_arguments()
+    repo_path = args.repo if args.repo != "." else None
 
     # Handle CLI commands
     if args.command == "checkout":
         from .cli import CheckoutCLI
 
-        repo_path = args.repo if args.repo != "." else None
         cli = CheckoutCLI(repo_path)
 
         if args.list_branches:
@@ -79,9 +103,6 @@ def main() -> None:
         return
 
     # Default behavior is to launch UI mode
-    # Pass repository path to UI if specified
-    repo_path = args.repo if args.repo != "." else None
-
     from .ui import run_ui
 
     run_ui(repo_path)
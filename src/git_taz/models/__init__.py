@@ -1,13 +1,23 @@
 """Data models for git-taz application."""
 
+import os
+import stat
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Dict, Optional, Tuple
 
 import git
 
 
-@dataclass
+def _has_git_marker(path: str) -> bool:
+    """Check whether path could be a work tree or a bare repository."""
+    if os.path.lexists(os.path.join(path, ".git")):
+        return True
+    return os.path.lexists(os.path.join(path, "HEAD")) and os.path.isdir(
+        os.path.join(path, "objects")
+    )
+
+
+@dataclass(slots=True)
 class GitRepository:
     """Represents a Git repository using GitPython."""
 
@@ -16,32 +26,84 @@ class GitRepository:
     exists: bool
     is_git: bool
     absolute_path: str
-    repo: Optional[git.Repo] = field(default=None, repr=False)
+    _repo: Optional[git.Repo] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _repo_opened: bool = field(default=False, init=False, repr=False, compare=False)
+
+    # Repositories found by from_path, shared by every caller
+    _discovered: ClassVar[Dict[Tuple[str, str], "GitRepository"]] = {}
+
+    @property
+    def repo(self) -> Optional[git.Repo]:
+        """Get the GitPython repository, opening it on first access."""
+        if not self._repo_opened:
+            self._repo_opened = True
+            if self.is_git:
+                try:
+                    self._repo = git.Repo(self.absolute_path)
+                except (git.exc.InvalidGitRepositoryError, git.exc.NoSuchPathError):
+                    # The marker files from_path saw did not make a repository
+                    self._repo = None
+                    self.is_git = False
+                    for key, cached in list(self._discovered.items()):
+                        if cached is self:
+                            del self._discovered[key]
+                else:
+                    # Reads like status must not take index.lock from the
+                    # user's own git commands, nor stop to ask for credentials
+                    self._repo.git.update_environment(
+                        GIT_OPTIONAL_LOCKS="0", GIT_TERMINAL_PROMPT="0"
+                    )
+        return self._repo
 
     @classmethod
     def from_path(cls, repo_path: str) -> "GitRepository":
-        repo_path_obj = Path(repo_path)
-        repo_absolute = repo_path_obj.absolute()
-        exists = repo_path_obj.exists()
-        is_git = False
-        repo = None
+        """Describe the repository at repo_path.
+
+        Repositories that are found are cached, and every caller shares the
+        same instance along with its lazily opened git.Repo. Paths that are
+        missing or not repositories are probed again on each call, so a
+        later ``git init`` is picked up. is_git comes from a check for git's
+        marker files; if opening the repository then fails, is_git is
+        cleared and the cache entry dropped.
+        """
+        repo_absolute = os.path.abspath(os.fspath(repo_path))
+        # Keyed on the absolute path too, so a later chdir can't hit a stale entry
+        key = (repo_path, repo_absolute)
+        repository = cls._discovered.get(key)
+        if repository is None:
+            repository = cls._probe(repo_path, repo_absolute)
+            if repository.is_git:
+                cls._discovered[key] = repository
+        return repository
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget repositories discovered by from_path."""
+        cls._discovered.clear()
+
+    @classmethod
+    def _probe(cls, repo_path: str, repo_absolute: str) -> "GitRepository":
         try:
-            repo = git.Repo(str(repo_absolute))
-            is_git = True
-        except (git.exc.InvalidGitRepositoryError, git.exc.NoSuchPathError):
-            repo = None
-            is_git = False
+            st = os.stat(repo_absolute)
+        except OSError:
+            st = None
+        # git.Repo is only opened once a caller actually needs it
         return cls(
             path=repo_path,
-            name=repo_absolute.name,
-            exists=exists,
-            is_git=is_git,
-            absolute_path=str(repo_absolute),
-            repo=repo,
+            name=os.path.basename(repo_absolute),
+            exists=st is not None,
+            is_git=(
+                st is not None
+                and stat.S_ISDIR(st.st_mode)
+                and _has_git_marker(repo_absolute)
+            ),
+            absolute_path=repo_absolute,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GitTool:
     """Represents a git tool/command."""
 
@@ -51,7 +113,7 @@ class GitTool:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Represents the result of running a tool."""
 
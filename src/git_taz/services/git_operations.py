@@ -1,6 +1,12 @@
 """Git operations service for git-taz."""
 
-from typing import List, Tuple, Optional
+import os
+import sys
+import threading
+from typing import Callable, Dict, Tuple, Optional, Union
+
+import git
+
 from ..models import GitRepository, ToolResult
 from ..tools import GitToolsManager
 
@@ -8,6 +14,8 @@ from ..tools import GitToolsManager
 class CheckoutResult:
     """Result of a checkout operation."""
 
+    __slots__ = ("success", "message", "target")
+
     def __init__(self, success: bool, message: str, target: Optional[str] = None):
         self.success = success
         self.message = message
@@ -17,36 +25,139 @@ class CheckoutResult:
 class GitOperationsService:
     """Service class for Git operations that can be used by both UI and CLI."""
 
-    def __init__(self, repository: GitRepository):
+    def __init__(
+        self,
+        repository: GitRepository,
+        tools_manager: Optional[GitToolsManager] = None,
+    ):
         self.repository = repository
-        self.tools_manager = GitToolsManager(repository)
-
-    def get_branches(self) -> List[str]:
-        """Get list of all branches."""
-        if not self.repository.repo:
-            return []
-        return sorted(b.name for b in self.repository.repo.branches)
-
-    def get_tags(self) -> List[str]:
-        """Get list of all tags."""
-        if not self.repository.repo:
-            return []
-        return sorted(t.name for t in self.repository.repo.tags)
-
-    def get_checkout_targets(self, target_type: str) -> List[Tuple[str, str]]:
+        self.tools_manager = tools_manager or GitToolsManager(repository)
+        # Ref lookups are cached until the refs or HEAD on disk change
+        self._branches: Optional[Tuple[Tuple[int, ...], Tuple[str, ...]]] = None
+        self._tags: Optional[Tuple[Tuple[int, ...], Tuple[str, ...]]] = None
+        self._current_branch: Optional[Tuple[int, str]] = None
+        self._targets: Dict[
+            str, Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]
+        ] = {}
+        self._files_backend: Optional[bool] = None
+        # Log and branch listings depend only on HEAD and the refs. Tools run
+        # on worker threads, so the result cache is only touched under a lock
+        self._tool_results: Dict[str, Tuple[Tuple[int, ...], ToolResult]] = {}
+        self._tool_results_lock = threading.Lock()
+
+    def _invalidate_refs(self) -> None:
+        """Forget cached branch, tag, current branch and tool lookups."""
+        self._branches = None
+        self._tags = None
+        self._current_branch = None
+        with self._tool_results_lock:
+            self._tool_results.clear()
+
+    def _refs_in_files(self, repo: git.Repo) -> bool:
+        """Check whether refs live in loose files and packed-refs.
+
+        The stamps below only track that layout. A reftable repository
+        rewrites its tables without touching them, so nothing about its refs
+        is cached.
+        """
+        if self._files_backend is None:
+            try:
+                storage = repo.config_reader("repository").get_value(
+                    "extensions", "refStorage", "files"
+                )
+            except Exception:
+                storage = "files"
+            self._files_backend = storage == "files"
+        return self._files_backend
+
+    def _head_mtime(self, repo: git.Repo) -> int:
+        """Get the modification time of HEAD, which every checkout rewrites."""
+        try:
+            return os.stat(os.path.join(repo.git_dir, "HEAD")).st_mtime_ns
+        except OSError:
+            return 0
+
+    def _refs_stamp(
+        self, common_dir: Union[str, "os.PathLike[str]"], namespace: str
+    ) -> Tuple[int, ...]:
+        """Get modification times that change whenever refs under namespace do.
+
+        Git writes refs through a lock file and a rename, so creating,
+        moving or deleting a loose ref touches its directory, and packing
+        rewrites packed-refs.
+        """
+        stamp = []
+        paths = [os.path.join(common_dir, "packed-refs")]
+        for root, _dirs, _files in os.walk(os.path.join(common_dir, "refs", namespace)):
+            paths.append(root)
+        for path in paths:
+            try:
+                stamp.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamp.append(0)
+        return tuple(stamp)
+
+    def _list_refs(self, repo: git.Repo, namespace: str) -> Tuple[str, ...]:
+        """List ref names under refs/<namespace>, sorted by git itself."""
+        try:
+            output: str = repo.git.for_each_ref(
+                "--sort=refname", "--format=%(refname:lstrip=2)", f"refs/{namespace}"
+            )
+        except git.exc.GitCommandError:
+            return ()
+        # Names are compared and hashed repeatedly by the UI, so intern them
+        return tuple(sys.intern(name) for name in output.splitlines())
+
+    def get_branches(self) -> Tuple[str, ...]:
+        """Get all branch names.
+
+        The result is shared with the cache, so it is returned as a tuple.
+        """
+        repo = self.repository.repo
+        if not repo:
+            return ()
+        if not self._refs_in_files(repo):
+            return self._list_refs(repo, "heads")
+        stamp = self._refs_stamp(repo.common_dir, "heads")
+        if self._branches is None or self._branches[0] != stamp:
+            self._branches = (stamp, self._list_refs(repo, "heads"))
+        return self._branches[1]
+
+    def get_tags(self) -> Tuple[str, ...]:
+        """Get all tag names.
+
+        The result is shared with the cache, so it is returned as a tuple.
+        """
+        repo = self.repository.repo
+        if not repo:
+            return ()
+        if not self._refs_in_files(repo):
+            return self._list_refs(repo, "tags")
+        stamp = self._refs_stamp(repo.common_dir, "tags")
+        if self._tags is None or self._tags[0] != stamp:
+            self._tags = (stamp, self._list_refs(repo, "tags"))
+        return self._tags[1]
+
+    def get_checkout_targets(self, target_type: str) -> Tuple[Tuple[str, str], ...]:
         """Get checkout targets formatted for UI Select widgets."""
         if target_type == "branches":
             names = self.get_branches()
         else:
             names = self.get_tags()
 
-        return [(name, name) for name in names]
+        # Reuse the pairs built for this exact cached list of names
+        cached = self._targets.get(target_type)
+        if cached is None or cached[0] is not names:
+            cached = (names, tuple((name, name) for name in names))
+            self._targets[target_type] = cached
+        return cached[1]
 
     def checkout(self, target: str) -> CheckoutResult:
         """Checkout a branch or tag."""
         if not self.repository.repo:
             return CheckoutResult(False, "No repository loaded")
 
+        self._invalidate_refs()
         try:
             self.repository.repo.git.checkout(target)
             return CheckoutResult(True, f"Successfully checked out {target}", target)
@@ -58,22 +169,56 @@ class GitOperationsService:
         if not self.repository.repo:
             return None
 
-        try:
-            return self.repository.repo.active_branch.name
-        except Exception:
-            return None
+        if not self._refs_in_files(self.repository.repo):
+            try:
+                return self.repository.repo.active_branch.name
+            except Exception:
+                return None
+
+        stamp = self._head_mtime(self.repository.repo)
+        if self._current_branch is None or self._current_branch[0] != stamp:
+            try:
+                name = self.repository.repo.active_branch.name
+            except Exception:
+                return None
+            self._current_branch = (stamp, name)
+        return self._current_branch[1]
 
     def get_status(self) -> ToolResult:
         """Get git status."""
         return self.tools_manager.git_status()
 
+    def _cached_result(
+        self,
+        name: str,
+        namespaces: Tuple[str, ...],
+        run: Callable[[], ToolResult],
+    ) -> ToolResult:
+        """Run a ref-only tool, or reuse its result while HEAD and refs hold."""
+        repo = self.repository.repo
+        if not repo or not self._refs_in_files(repo):
+            return run()
+        stamp: Tuple[int, ...] = (self._head_mtime(repo),)
+        for namespace in namespaces:
+            stamp += self._refs_stamp(repo.common_dir, namespace)
+        with self._tool_results_lock:
+            cached = self._tool_results.get(name)
+        if cached is None or cached[0] != stamp:
+            # The tool itself runs unlocked so other tools are not held up
+            cached = (stamp, run())
+            with self._tool_results_lock:
+                self._tool_results[name] = cached
+        return cached[1]
+
     def get_log(self) -> ToolResult:
         """Get git log."""
-        return self.tools_manager.git_log()
+        return self._cached_result("log", ("heads",), self.tools_manager.git_log)
 
     def get_branches_info(self) -> ToolResult:
         """Get branches info."""
-        return self.tools_manager.git_branches()
+        return self._cached_result(
+            "branches", ("heads", "remotes"), self.tools_manager.git_branches
+        )
 
     def get_diff(self) -> ToolResult:
         """Get git diff."""
@@ -1,99 +1,147 @@
 """Git tools and utilities."""
 
-from typing import Dict, List
+import re
+from collections import defaultdict
+from types import MappingProxyType
+from typing import DefaultDict, Iterable, Iterator, List, Mapping, Tuple
 
 from ..models import GitRepository, GitTool, ToolResult
 
+_DATE_FORMAT = "%Y-%m-%d %H:%M"
+# Committer date, author name, full hash and raw message, unit-separated
+_LOG_FORMAT = "%cd%x1f%an%x1f%H%x1f%B"
+# First non-blank line of a commit message, capped at 80 chars; an empty or
+# whitespace-only message does not match
+_FIRST_LINE_RE = re.compile(r"\s*(\S[^\n]{0,79})")
+
+
+def _records(output: bytes) -> Iterator[str]:
+    """Decode NUL-separated git output one record at a time.
+
+    Undecodable bytes in paths or commit messages become U+FFFD instead of
+    surrogates that would fail later when written to the terminal.
+    """
+    for record in output.split(b"\0"):
+        if record:
+            yield record.decode("utf-8", "replace")
+
+
+# Tool descriptors never change, so they are built once at import
+_TOOLS: Mapping[str, GitTool] = MappingProxyType(
+    {
+        "status": GitTool(
+            name="Git Status",
+            description="Show the working tree status",
+            category="Information",
+        ),
+        "log": GitTool(
+            name="Git Log", description="Show commit logs", category="Information"
+        ),
+        "branches": GitTool(
+            name="List Branches",
+            description="List all branches",
+            category="Information",
+        ),
+        "diff": GitTool(
+            name="Git Diff",
+            description="Show changes between commits",
+            category="Analysis",
+        ),
+    }
+)
+
+
+def _group_by_category(tools: Iterable[GitTool]) -> Mapping[str, Tuple[GitTool, ...]]:
+    """Group tools by category, keeping the order categories first appear."""
+    categories: DefaultDict[str, List[GitTool]] = defaultdict(list)
+    for tool in tools:
+        categories[tool.category].append(tool)
+    return MappingProxyType({name: tuple(group) for name, group in categories.items()})
+
+
+_TOOLS_BY_CATEGORY = _group_by_category(_TOOLS.values())
+
 
 class GitToolsManager:
     """Manages git tools and operations."""
 
     def __init__(self, repository: GitRepository):
         self.repository = repository
-        self._tools = self._initialize_tools()
-
-    def _initialize_tools(self) -> Dict[str, GitTool]:
-        """Initialize available git tools."""
-        return {
-            "status": GitTool(
-                name="Git Status",
-                description="Show the working tree status",
-                category="Information",
-            ),
-            "log": GitTool(
-                name="Git Log", description="Show commit logs", category="Information"
-            ),
-            "branches": GitTool(
-                name="List Branches",
-                description="List all branches",
-                category="Information",
-            ),
-            "diff": GitTool(
-                name="Git Diff",
-                description="Show changes between commits",
-                category="Analysis",
-            ),
-        }
-
-    def get_tools_by_category(self) -> Dict[str, List[GitTool]]:
+        self._tools = _TOOLS
+
+    def get_tools_by_category(self) -> Mapping[str, Tuple[GitTool, ...]]:
         """Get tools organized by category."""
-        categories: Dict[str, List[GitTool]] = {}
-        for tool in self._tools.values():
-            if tool.category not in categories:
-                categories[tool.category] = []
-            categories[tool.category].append(tool)
-        return categories
+        return _TOOLS_BY_CATEGORY
 
     def get_all_tools(self) -> List[GitTool]:
         """Get all available tools."""
         return list(self._tools.values())
 
     def git_status(self) -> "ToolResult":
-        """Get git status using GitPython."""
+        """Get git status from a single porcelain v2 status call."""
         try:
             if not self.repository.repo:
                 return ToolResult(success=False, message="No repository loaded")
 
-            # Get status information
-            repo = self.repository.repo
-            status_info = []
-
-            # Untracked files
-            untracked = repo.untracked_files
-            for file in untracked:
-                status_info.append(f"?? {file}")
-
-            # Modified files
-            for item in repo.index.diff(None):
-                status_info.append(f" M {item.a_path}")
-
-            # Staged files
-            for item in repo.index.diff("HEAD"):
-                status_info.append(f"M  {item.a_path}")
-
+            output = self.repository.repo.git.status(
+                "--porcelain=v2", "-z", "--untracked-files=all", stdout_as_string=False
+            )
+
+            untracked = []
+            unstaged = []
+            staged = []
+            records = _records(output)
+            for record in records:
+                kind = record[:1]
+                if kind == "?":
+                    untracked.append(f"?? {record[2:]}")
+                    continue
+                if kind == "1":
+                    fields = record.split(" ", 8)
+                elif kind == "2":
+                    fields = record.split(" ", 9)
+                    next(records, None)  # Original path of a rename or copy
+                elif kind == "u":
+                    fields = record.split(" ", 10)
+                else:
+                    continue
+
+                path = fields[-1]
+                xy = fields[1]  # Index and work tree status letters
+                if xy[1] != ".":
+                    unstaged.append(f" M {path}")
+                if xy[0] != ".":
+                    staged.append(f"M  {path}")
+
+            status_info = untracked + unstaged + staged
             output = "\n".join(status_info) if status_info else "No changes"
             return ToolResult(success=True, message="Status retrieved", output=output)
         except Exception as e:
             return ToolResult(success=False, message=f"Error getting status: {e}")
 
     def git_log(self, max_count: int = 15) -> "ToolResult":
-        """Get git log using GitPython."""
+        """Get git log from a single formatted log call."""
         try:
             if not self.repository.repo:
                 return ToolResult(success=False, message="No repository loaded")
 
-            repo = self.repository.repo
-            commits = list(repo.iter_commits(max_count=max_count))
+            # One git log call formats every field, so no commit objects are read
+            output = self.repository.repo.git.log(
+                f"--max-count={max_count}",
+                f"--date=format:{_DATE_FORMAT}",
+                f"--format={_LOG_FORMAT}",
+                "-z",
+                stdout_as_string=False,
+            )
 
             log_lines = []
-            for commit in commits:
-                # Format similar to your git log format
-                date_str = commit.committed_datetime.strftime("%Y-%m-%d %H:%M")
-                author = (commit.author.name or "Unknown")[:22]
-                short_hash = str(commit.hexsha)[:7]
-                message = str(commit.message).strip().split("\n")[0][:80]
-
-                log_line = f"{date_str} {author:<22} {short_hash} {message}"
+            for record in _records(output):
+                date_str, author_name, hexsha, body = record.split("\x1f", 3)
+                author = (author_name or "Unknown")[:22]
+                summary = _FIRST_LINE_RE.match(body)
+                message = summary[1] if summary else ""
+
+                log_line = f"{date_str} {author:<22} {hexsha[:7]} {message}"
                 log_lines.append(log_line)
 
             output = "\n".join(log_lines)
@@ -111,9 +159,15 @@ class GitToolsManager:
             repo = self.repository.repo
             branches = []
 
+            # Read HEAD once; a detached HEAD has no active branch
+            try:
+                active = repo.active_branch.name
+            except TypeError:
+                active = None
+
             # Local branches
             for branch in repo.branches:
-                marker = "* " if branch == repo.active_branch else "  "
+                marker = "* " if branch.name == active else "  "
                 branches.append(f"{marker}{branch.name}")
 
             # Remote branches
@@ -127,28 +181,33 @@ class GitToolsManager:
             return ToolResult(success=False, message=f"Error getting branches: {e}")
 
     def git_diff(self, staged: bool = False) -> "ToolResult":
-        """Get git diff using GitPython."""
+        """Get git diff from a single raw diff call."""
 
         try:
             if not self.repository.repo:
                 return ToolResult(success=False, message="No repository loaded")
 
-            repo = self.repository.repo
-
+            args = ["--raw", "-z", "-M"]
             if staged:
-                diff = repo.index.diff("HEAD")
-            else:
-                diff = repo.index.diff(None)
+                args.insert(0, "--cached")
+            output = self.repository.repo.git.diff(*args, stdout_as_string=False)
 
             diff_lines = []
-            for item in diff:
-                diff_lines.append(f"diff --git a/{item.a_path} b/{item.b_path}")
-                if item.change_type == "M":
-                    diff_lines.append(f"Modified: {item.a_path}")
-                elif item.change_type == "A":
-                    diff_lines.append(f"Added: {item.a_path}")
-                elif item.change_type == "D":
-                    diff_lines.append(f"Deleted: {item.a_path}")
+            records = _records(output)
+            for record in records:
+                if not record.startswith(":"):
+                    continue
+                change_type = record.split(" ")[-1][:1]
+                a_path = next(records, "")
+                b_path = next(records, "") if change_type in "RC" else a_path
+
+                diff_lines.append(f"diff --git a/{a_path} b/{b_path}")
+                if change_type == "M":
+                    diff_lines.append(f"Modified: {a_path}")
+                elif change_type == "A":
+                    diff_lines.append(f"Added: {a_path}")
+                elif change_type == "D":
+                    diff_lines.append(f"Deleted: {a_path}")
 
             output = "\n".join(diff_lines) if diff_lines else "No differences"
             return ToolResult(success=True, message="Diff retrieved", output=output)
@@ -2,9 +2,10 @@
 
 from typing import Optional
 
-from .app import run_app
-
 
 def run_ui(repo_path: Optional[str] = None) -> None:
     """Run the UI."""
+    # Textual and rich are only imported once the UI is actually launched
+    from .app import run_app
+
     run_app(repo_path)
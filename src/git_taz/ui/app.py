@@ -1,15 +1,24 @@
 """Main Textual application for git-taz."""
 
+import asyncio
+import os
+import re
+import subprocess
+import sys
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, cast
 
+import git
 from rich.text import Text
+from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.command import Hit, Hits, Provider
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     DataTable,
@@ -21,50 +30,99 @@ from textual.widgets import (
     Static,
 )
 
-from ..models import GitRepository
+from ..models import GitRepository, ToolResult
 from ..services import GitOperationsService
 from ..tools import GitToolsManager
 
+_DATE_FORMAT = "%Y-%m-%d %H:%M"
+
+# First non-blank line of a commit message, without copying the rest; an
+# empty or whitespace-only message does not match
+_SUMMARY_RE = re.compile(r"\s*(\S[^\n]*)")
+
+# Seconds a git tool may run before the log says it is still busy
+_SLOW_TOOL_NOTICE = 2.0
+
+# Emoji prefixes that tell log levels apart in the output panel
+_LOG_PREFIX = {
+    "error": "🔴 ",
+    "success": "✅ ",
+    "warning": "⚠️  ",
+    "info": "ℹ️  ",
+}
+_DEFAULT_PREFIX = _LOG_PREFIX["info"]
+
+# Date, author, short hash, summary and refs, as shown in the commit table
+CommitRow = Tuple[str, str, str, str, str]
+
+
+class RepoTree(DirectoryTree):
+    """A DirectoryTree that leaves out the .git directory and ignored entries."""
+
+    def filter_paths(self, paths: Iterable[Path]) -> Iterable[Path]:
+        """Hide the .git directory and anything git is told to ignore."""
+        paths = [path for path in paths if path.name != ".git"]
+        if not paths:
+            return paths
+        # One check-ignore per listed directory, run on the loader thread.
+        # Names go over stdin NUL-separated, so git neither quotes them nor
+        # runs into the argument length limit on very large directories.
+        names = b"".join(os.fsencode(path.name) + b"\0" for path in paths)
+        try:
+            process = git.Git(str(paths[0].parent)).check_ignore(
+                "--stdin", "-z", as_process=True, istream=subprocess.PIPE
+            )
+            output, _ = process.proc.communicate(names)
+        except (git.exc.GitCommandError, OSError):
+            return paths
+        # Nothing is printed when nothing is ignored or outside a repository
+        ignored = {os.fsdecode(name) for name in output.split(b"\0") if name}
+        return [path for path in paths if path.name not in ignored]
+
 
 class GitToolsProvider(Provider):
     """A command provider for Git tools."""
 
+    # Define your Git tools
+    TOOLS = (
+        ("status", "Show working tree status"),
+        ("log", "Show commit history"),
+        ("branches", "List branches"),
+        ("diff", "Show file differences"),
+    )
+
     async def startup(self) -> None:
         """Called once when the command palette is opened."""
-        pass
+        # Build each command's text, letters and runner once, not per keystroke;
+        # a fuzzy match needs every query letter somewhere in the command
+        self._entries = [
+            (
+                f"git {tool_id}",
+                frozenset(f"git {tool_id}"),
+                partial(self._run_tool, tool_id),
+                description,
+            )
+            for tool_id, description in self.TOOLS
+        ]
+
+    def _run_tool(self, tool: str) -> None:
+        """Run a Git tool in the app."""
+        cast("GitTazApp", self.app)._execute_git_tool(tool)
 
     async def search(self, query: str) -> Hits:
         """Search for Git tool commands."""
-        matcher = self.matcher(query)
+        if not query:
+            return
 
-        # Define your Git tools
-        tools = [
-            ("status", "Show working tree status"),
-            ("log", "Show commit history"),
-            ("branches", "List branches"),
-            ("diff", "Show file differences"),
-        ]
+        matcher = self.matcher(query)
+        letters = set(query.lower()) - {" "}
 
-        for tool_id, description in tools:
-            command = f"git {tool_id}"
+        for command, command_letters, runner, description in self._entries:
+            if not letters <= command_letters:
+                continue
             score = matcher.match(command)
             if score > 0:
-
-                def make_tool_runner(tool: str):
-                    def run_tool():
-                        from typing import cast
-
-                        app = cast("GitTazApp", self.app)
-                        app._execute_git_tool(tool)
-
-                    return run_tool
-
-                yield Hit(
-                    score,
-                    matcher.highlight(command),
-                    make_tool_runner(tool_id),
-                    help=description,
-                )
+                yield Hit(score, matcher.highlight(command), runner, help=description)
 
 
 class GitTazApp(App):
@@ -83,6 +141,15 @@ class GitTazApp(App):
     # Add the custom Git tools provider to the command palette
     COMMANDS = App.COMMANDS | {GitToolsProvider}
 
+    # git log arguments for the commit table: hash, author, commit time,
+    # decorations and message per commit, NUL-terminated
+    _COMMIT_LOG_ARGS = (
+        "--max-count=15",
+        "--format=%H%x1f%an%x1f%ct%x1f%D%x1f%B",
+        "-z",
+        "HEAD",
+    )
+
     CSS = """
     Screen {
         layout: horizontal;
@@ -147,6 +214,12 @@ class GitTazApp(App):
         self.tools_manager: Optional[GitToolsManager] = None
         self.git_operations: Optional[GitOperationsService] = None
         self.sidebar_visible = True
+        self._last_head_sha: Optional[str] = None
+        self._loaded_rows: Dict[str, CommitRow] = {}
+        self._refresh_timer: Optional[Timer] = None
+        self._pending_repo_details: Optional[Text] = None
+        self._repo_info_key: Optional[Tuple[str, str, Optional[str]]] = None
+        self._tool_dispatch: Dict[str, Callable[[], ToolResult]] = {}
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -156,7 +229,8 @@ class GitTazApp(App):
             yield Static("Repository Info", classes="repo_info")
             yield Static("Loading...", id="repo_details")
             yield Static("Files", id="files_title")
-            yield DirectoryTree(str(self.repo_path), id="repo_tree")
+            # The file tree is mounted after the first paint, see _mount_repo_tree
+            yield Static("Loading...", id="files_placeholder")
 
         with Container(id="main"):
             with Container(id="commits_panel"):
@@ -171,31 +245,113 @@ class GitTazApp(App):
 
     def on_mount(self) -> None:
         """Called when app starts."""
+        # Look the long-lived widgets up once instead of on every update
+        self._commits_table = self.query_one("#commits_table", DataTable)
+        self._repo_details = self.query_one("#repo_details", Static)
+        self._command_log = self.query_one("#command_log", Log)
+        self._sidebar = self.query_one("#sidebar", Container)
+        self._main_panel = self.query_one("#main", Container)
         self.setup_commits_table()
         self.load_repository()
+        self.call_after_refresh(self._mount_repo_tree)
+
+    def on_unmount(self) -> None:
+        """Stop the repository's long-lived git cat-file helpers on exit."""
+        if self.repository and self.repository.repo:
+            self.repository.repo.close()
+
+    def _mount_repo_tree(self) -> None:
+        """Swap the files placeholder for the directory tree once it is seen."""
+        if not self.sidebar_visible or self.query("#repo_tree"):
+            return
+        # Swap in one repaint rather than showing the sidebar without either
+        with self.batch_update():
+            self.query_one("#files_placeholder").remove()
+            self._sidebar.mount(RepoTree(str(self.repo_path), id="repo_tree"))
 
     def setup_commits_table(self) -> None:
         """Setup the commits table with columns."""
-        table = self.query_one("#commits_table", DataTable)
-        table.add_columns("Date", "Author", "Hash", "Message", "Refs")
+        table = self._commits_table
+        self._commit_columns = table.add_columns(
+            "Date", "Author", "Hash", "Message", "Refs"
+        )
         table.cursor_type = "row"
 
-    def load_repository(self) -> None:
-        """Load the Git repository."""
+    def load_repository(self, force: bool = False) -> None:
+        """Load the Git repository in a background thread."""
+        self._load_repository_worker(force)
+
+    @work(thread=True, exclusive=True)
+    def _load_repository_worker(self, force: bool) -> None:
+        """Open the repository and read its commits off the event loop."""
         try:
-            self.repository = GitRepository.from_path(str(self.repo_path))
-            self.tools_manager = GitToolsManager(self.repository)
-            self.git_operations = GitOperationsService(self.repository)
-            self.update_repo_info()
-            self.load_commits()
+            repository = GitRepository.from_path(str(self.repo_path))
+            previous = self.repository
+            if (
+                previous is not None
+                and repository.absolute_path == previous.absolute_path
+                and repository.is_git == previous.is_git
+                and self.tools_manager is not None
+                and self.git_operations is not None
+            ):
+                # Same repository as before: keep its open git.Repo and the
+                # service caches, which check the refs on disk themselves
+                repository = previous
+                tools_manager = self.tools_manager
+                git_operations = self.git_operations
+            else:
+                tools_manager = GitToolsManager(repository)
+                git_operations = GitOperationsService(repository, tools_manager)
         except Exception as e:
-            self.query_one("#repo_details", Static).update(f"Error: {e}")
+            self.call_from_thread(self._repo_details.update, f"Error: {e}")
+            return
+
+        try:
+            commits = self.read_commits(repository, force)
+        except Exception as e:
+            self.call_from_thread(
+                self.log_message, f"Error loading commits: {e}", "error"
+            )
+            commits = None
+
+        self.call_from_thread(
+            self._apply_repository, repository, tools_manager, git_operations, commits
+        )
+
+    def _apply_repository(
+        self,
+        repository: GitRepository,
+        tools_manager: GitToolsManager,
+        git_operations: GitOperationsService,
+        commits: Optional[Tuple[Optional[str], Dict[str, CommitRow]]],
+    ) -> None:
+        """Install a loaded repository and show it, on the UI thread."""
+        self.repository = repository
+        self.tools_manager = tools_manager
+        self.git_operations = git_operations
+        self._tool_dispatch = {
+            "status": git_operations.get_status,
+            "log": git_operations.get_log,
+            "branches": git_operations.get_branches_info,
+            "diff": git_operations.get_diff,
+        }
+        # Repaint the sidebar and the commit table together, not twice
+        with self.batch_update():
+            self.update_repo_info()
+            if commits is not None:
+                self.load_commits(*commits)
 
     def update_repo_info(self) -> None:
         """Update the repository information display."""
-        if self.repository and self.repository.repo:
-            try:
-                current_branch = self.repository.repo.active_branch.name
+        if self.repository and self.repository.repo and self.git_operations:
+            # The branch name is cached on HEAD's mtime by the service
+            current_branch = self.git_operations.get_current_branch()
+            key = (self.repository.name, self.repository.path, current_branch)
+            if key == self._repo_info_key:
+                return
+            self._repo_info_key = key
+
+            if current_branch is not None:
                 self.sub_title = f"Git Utility Tool - {current_branch}"
 
                 repo_text = Text()
@@ -203,93 +359,145 @@ class GitTazApp(App):
                 repo_text.append(f"🌿 {current_branch}\n", style="green")
                 repo_text.append(f"📍 {self.repository.path}", style="dim")
 
-                self.query_one("#repo_details", Static).update(repo_text)
-            except Exception:
+                self._show_repo_details(repo_text)
+            else:
                 self.sub_title = "Git Utility Tool"
                 repo_text = Text()
                 repo_text.append(f"📁 {self.repository.name}\n", style="bold cyan")
                 repo_text.append("❌ No Git repo", style="red")
-                self.query_one("#repo_details", Static).update(repo_text)
-
-    def load_commits(self) -> None:
-        """Load commit history into the table."""
-        if not self.repository or not self.repository.repo:
-            return
-
-        table = self.query_one("#commits_table", DataTable)
-        table.clear()
+                self._show_repo_details(repo_text)
 
+    def _show_repo_details(self, repo_text: Text) -> None:
+        """Update the sidebar details, or hold them while it is hidden."""
+        if self.sidebar_visible:
+            self._repo_details.update(repo_text)
+        else:
+            self._pending_repo_details = repo_text
+
+    def read_commits(
+        self, repository: GitRepository, force: bool = False
+    ) -> Optional[Tuple[Optional[str], Dict[str, CommitRow]]]:
+        """Read and format the commit history for the table.
+
+        Returns the HEAD sha and the rows keyed by commit sha, or None when there is nothing to
+        show or HEAD still points at the commit the table was last filled
+        from and force is not set.
+        """
+        repo = repository.repo
+        if not repo:
+            return None
+
+        # A one-shot rev-parse rather than repo.head.commit, whose object
+        # lookup goes through GitPython's shared, unlocked cat-file pipe that
+        # an overlapping load on another worker thread could be using
         try:
-            # Get commits using your preferred format
-            commits = list(self.repository.repo.iter_commits("HEAD", max_count=15))
-
-            for commit in commits:
-                # Format date
-                commit_date = datetime.fromtimestamp(commit.committed_date).strftime(
-                    "%Y-%m-%d %H:%M"
-                )
-
-                # Format author (truncate to 22 chars)
-                author_name = commit.author.name or "Unknown"
-                author = author_name[:22] if len(author_name) > 22 else author_name
-
-                # Format hash (abbreviated)
-                short_hash = str(commit.hexsha)[:7]
-
-                # Format message (truncate to 80 chars)
-                commit_message = str(commit.message)
-                message_lines = commit_message.strip().split("\n")
-                message = message_lines[0] if message_lines else ""
-                if len(message) > 80:
-                    message = message[:77] + "..."
-
-                # Format refs (branches, tags)
-                refs = ""
-                try:
-                    refs_list = []
-                    for ref in self.repository.repo.refs:
-                        if ref.commit == commit:
-                            refs_list.append(ref.name.split("/")[-1])
-                    if refs_list:
-                        refs = f"({', '.join(refs_list)})"
-                except Exception:
-                    pass
-
-                table.add_row(commit_date, author, short_hash, message, refs)
+            head_sha: Optional[str] = repo.git.rev_parse("--verify", "-q", "HEAD")
+        except git.exc.GitCommandError:
+            head_sha = None  # HEAD has no commits yet
+        if not force and head_sha is not None and head_sha == self._last_head_sha:
+            return None
+
+        # One git log call yields every field, refs included, for all rows
+        output = repo.git.log(*self._COMMIT_LOG_ARGS, stdout_as_string=False)
+
+        rows: Dict[str, CommitRow] = {}
+        fromtimestamp = datetime.fromtimestamp
+        for record in output.split(b"\0"):
+            if not record:
+                continue
+            sha, author_name, timestamp, decoration, body = record.decode(
+                "utf-8", "replace"
+            ).split("\x1f", 4)
+
+            commit_date = fromtimestamp(int(timestamp)).strftime(_DATE_FORMAT)
+
+            # Format author (truncate to 22 chars); the same few authors repeat
+            # down the table and across refreshes, so share one string each
+            author = sys.intern((author_name or "Unknown")[:22])
+
+            # Format hash (abbreviated)
+            short_hash = sha[:7]
+
+            # Format message, first line only (truncate to 80 chars)
+            summary = _SUMMARY_RE.match(body)
+            message = summary[1].rstrip() if summary else ""
+            if len(message) > 80:
+                message = message[:77] + "..."
+
+            # Format refs (branches, tags) by their last path component
+            refs_list = [
+                name.removeprefix("HEAD -> ").removeprefix("tag: ").split("/")[-1]
+                for name in decoration.split(", ")
+                if name and name != "HEAD"
+            ]
+            refs = sys.intern(f"({', '.join(refs_list)})") if refs_list else ""
+
+            rows[sha] = (commit_date, author, short_hash, message, refs)
+
+        return head_sha, rows
+
+    def load_commits(self, head_sha: Optional[str], rows: Dict[str, CommitRow]) -> None:
+        """Show preformatted rows, touching only what changed in the table."""
+        loaded = self._loaded_rows
+        self._last_head_sha = head_sha
+        if rows == loaded and list(rows) == list(loaded):
+            return
 
-        except Exception as e:
-            self.log_message(f"Error loading commits: {e}", "error")
+        table = self._commits_table
+        if list(rows) == list(loaded):
+            # Same commits in the same order, e.g. a tag was added on refresh
+            for sha, row in rows.items():
+                for column, old, new in zip(self._commit_columns, loaded[sha], row):
+                    if old != new:
+                        table.update_cell(sha, column, new)
+        else:
+            # DataTable can only append, so new commits mean a rebuild
+            table.clear()
+            for sha, row in rows.items():
+                table.add_row(*row, key=sha)
+        self._loaded_rows = rows
 
     def action_refresh(self) -> None:
         """Refresh the repository information."""
-        self.load_repository()
+        # Key repeat can fire refresh many times; let a burst share one load
+        if self._refresh_timer is None:
+            self._refresh_timer = self.set_timer(0.15, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        """Reload the repository once a burst of refreshes has settled."""
+        self._refresh_timer = None
+        GitRepository.clear_cache()
+        # New tags or branches can appear without HEAD moving
+        self.load_repository(force=True)
         self.log_message("Repository refreshed", "info")
 
     def action_toggle_sidebar(self) -> None:
         """Toggle the sidebar visibility."""
-        sidebar = self.query_one("#sidebar")
-        main_panel = self.query_one("#main")
-        if self.sidebar_visible:
-            sidebar.styles.display = "none"
-            main_panel.styles.width = "100%"
-        else:
-            sidebar.styles.display = "block"
-            main_panel.styles.width = "75%"
-        self.sidebar_visible = not self.sidebar_visible
+        sidebar = self._sidebar
+        main_panel = self._main_panel
+        # Both panels change size; lay them out in a single pass
+        with self.batch_update():
+            if self.sidebar_visible:
+                sidebar.styles.display = "none"
+                main_panel.styles.width = "100%"
+            else:
+                sidebar.styles.display = "block"
+                main_panel.styles.width = "75%"
+            self.sidebar_visible = not self.sidebar_visible
+            if self.sidebar_visible and self._pending_repo_details is not None:
+                self._repo_details.update(self._pending_repo_details)
+                self._pending_repo_details = None
+            self._mount_repo_tree()
 
     def log_message(self, message: str, level: str = "info") -> None:
         """Log a message to the output log."""
-        log_widget = self.query_one("#command_log", Log)
-
-        # Use emoji prefixes for visual distinction
-        if level == "error":
-            log_widget.write_line(f"🔴 {message}")
-        elif level == "success":
-            log_widget.write_line(f"✅ {message}")
-        elif level == "warning":
-            log_widget.write_line(f"⚠️  {message}")
-        else:
-            log_widget.write_line(f"ℹ️  {message}")
+        prefix = _LOG_PREFIX.get(level, _DEFAULT_PREFIX)
+        self._command_log.write_line(prefix + message)
+
+    def log_lines(self, messages: List[str], level: str = "info") -> None:
+        """Log several messages at one level with a single write."""
+        prefix = _LOG_PREFIX.get(level, _DEFAULT_PREFIX)
+        self._command_log.write_lines([prefix + message for message in messages])
 
     async def run_git_tool(self, tool_name: str) -> None:
         """Run a Git tool and display the results."""
@@ -300,28 +508,32 @@ class GitTazApp(App):
         self.log_message(f"Running git {tool_name}...", "info")
 
         try:
-            if tool_name == "status":
-                result = self.git_operations.get_status()
-            elif tool_name == "log":
-                result = self.git_operations.get_log()
-            elif tool_name == "branches":
-                result = self.git_operations.get_branches_info()
-            elif tool_name == "diff":
-                result = self.git_operations.get_diff()
-            else:
+            tool = self._tool_dispatch.get(tool_name)
+            if tool is None:
                 self.log_message(f"Unknown tool: {tool_name}", "error")
                 return
+            # The tools shell out to git; wait on a thread, not the event loop
+            task = asyncio.ensure_future(asyncio.to_thread(tool))
+            done, _ = await asyncio.wait({task}, timeout=_SLOW_TOOL_NOTICE)
+            if not done:
+                self.log_message(f"git {tool_name} is still running...", "warning")
+            result = await task
 
             if result.success:
-                self.log_message(f"✓ git {tool_name} completed", "success")
-                if result.output:
-                    # Split long output into multiple lines
-                    lines = result.output.split("\n")
-                    for line in lines[:20]:  # Limit to first 20 lines
-                        if line.strip():
-                            self.log_message(line.strip(), "info")
-                    if len(lines) > 20:
-                        self.log_message(f"... ({len(lines) - 20} more lines)", "info")
+                # Show the status line and the output in one repaint
+                with self.batch_update():
+                    self.log_message(f"✓ git {tool_name} completed", "success")
+                    if result.output:
+                        # Only the first 20 lines are shown, so only split those
+                        total = result.output.count("\n") + 1
+                        lines = [
+                            line.strip()
+                            for line in result.output.split("\n", 20)[:20]
+                            if line.strip()
+                        ]
+                        if total > 20:
+                            lines.append(f"... ({total - 20} more lines)")
+                        self.log_lines(lines)
             else:
                 self.log_message(f"✗ git {tool_name} failed: {result.message}", "error")
                 if result.error:
@@ -337,19 +549,24 @@ class GitTazApp(App):
     class CheckoutScreen(Screen):
         """Screen for selecting branches/tags to checkout."""
 
+        # Options for the type selector, shared by every dialog instance
+        TARGET_TYPES = (
+            ("Branches", "branches"),
+            ("Tags", "tags"),
+        )
+
         def __init__(self, git_operations: GitOperationsService, parent_app):
             super().__init__()
             self.git_operations = git_operations
             self.parent_app = parent_app
+            # Options per target type, kept while the dialog is open
+            self._target_cache: Dict[str, Tuple[Tuple[str, str], ...]] = {}
 
         def compose(self) -> ComposeResult:
             yield Vertical(
                 Static("Checkout Branch/Tag", classes="dialog-title"),
                 Select(
-                    [
-                        ("Branches", "branches"),
-                        ("Tags", "tags"),
-                    ],
+                    self.TARGET_TYPES,
                     prompt="Select type",
                     id="type_select",
                     value="branches",
@@ -373,7 +590,10 @@ class GitTazApp(App):
 
         def update_targets(self, target_type: str) -> None:
             target_select = self.query_one("#target_select", Select)
-            targets = self.git_operations.get_checkout_targets(target_type)
+            targets = self._target_cache.get(target_type)
+            if targets is None:
+                targets = self.git_operations.get_checkout_targets(target_type)
+                self._target_cache[target_type] = targets
             target_select.set_options(targets)
 
         def on_button_pressed(self, message: Button.Pressed) -> None:
@@ -384,6 +604,7 @@ class GitTazApp(App):
                 if selected_target:
                     result = self.git_operations.checkout(str(selected_target))
                     if result.success:
+                        self._target_cache.clear()
                         self.parent_app.log_message(result.message, "success")
                         self.parent_app.load_repository()  # Refresh the UI
                         self.dismiss()
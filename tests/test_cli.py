@@ -4,37 +4,48 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from io import StringIO
 import sys
+from types import SimpleNamespace
 
 from src.git_taz.cli import CheckoutCLI
+from src.git_taz.models import GitRepository
 from src.git_taz.services.git_operations import CheckoutResult
 
 
+@pytest.fixture(scope="class")
+def shared_cli():
+    """Create one CheckoutCLI whose dependencies stay mocked for the class."""
+    with patch("src.git_taz.cli.checkout_cli.GitRepository") as mock_repo_class:
+        with patch("src.git_taz.cli.checkout_cli.GitOperationsService"):
+            mock_repo_class.from_path.return_value = Mock()
+            yield CheckoutCLI(".")
+
+
 class TestCheckoutCLI:
     """Test CheckoutCLI class."""
 
+    @pytest.fixture(autouse=True)
+    def clear_repo_cache(self):
+        """Start every test without previously discovered repositories."""
+        GitRepository.clear_cache()
+        yield
+        GitRepository.clear_cache()
+
     @pytest.fixture
     def mock_service(self):
-        """Create a mock GitOperationsService."""
-        service = Mock()
-        service.get_branches.return_value = ["main", "develop", "feature/test"]
-        service.get_tags.return_value = ["v1.0.0", "v2.0.0"]
-        service.get_current_branch.return_value = "main"
-        return service
+        """Create a stub GitOperationsService with fixed ref listings."""
+        # Only checkout is asserted on, so only it needs to be a Mock
+        return SimpleNamespace(
+            get_branches=lambda: ["main", "develop", "feature/test"],
+            get_tags=lambda: ["v1.0.0", "v2.0.0"],
+            get_current_branch=lambda: "main",
+            checkout=Mock(),
+        )
 
     @pytest.fixture
-    def cli_instance(self, mock_service):
-        """Create a CheckoutCLI instance with mocked dependencies."""
-        with patch("src.git_taz.cli.checkout_cli.GitRepository") as mock_repo_class:
-            with patch(
-                "src.git_taz.cli.checkout_cli.GitOperationsService"
-            ) as mock_service_class:
-                mock_repo = Mock()
-                mock_repo_class.from_path.return_value = mock_repo
-                mock_service_class.return_value = mock_service
-
-                cli = CheckoutCLI(".")
-                cli.git_operations = mock_service
-                return cli
+    def cli_instance(self, shared_cli, mock_service):
+        """Give the shared CLI a fresh service stub for each test."""
+        shared_cli.git_operations = mock_service
+        return shared_cli
 
     def test_init_success(self):
         """Test successful CLI initialization."""
@@ -51,8 +62,16 @@ class TestCheckoutCLI:
 
                 mock_repo_class.from_path.assert_called_once_with(".")
                 mock_service_class.assert_called_once_with(mock_repo)
-                assert cli.repository == mock_repo
-                assert cli.git_operations == mock_service
+                assert cli.repository is mock_repo
+                assert cli.git_operations is mock_service
+
+    def test_init_reuses_cached_repository(self):
+        """Test that repository discovery runs once per path."""
+        with patch("src.git_taz.cli.checkout_cli.GitOperationsService"):
+            first = CheckoutCLI(".")
+            second = CheckoutCLI(None)
+
+        assert first.repository is second.repository
 
     def test_init_failure(self):
         """Test CLI initialization failure."""
@@ -215,12 +234,13 @@ class TestCheckoutCLI:
 
     def test_checkout_from_list_no_targets(self, cli_instance, mock_service, capsys):
         """Test checkout from list when no targets available."""
-        mock_service.get_branches.return_value = []
+        mock_service.get_branches = lambda: []
 
         cli_instance._checkout_from_list("branches")
 
         captured = capsys.readouterr()
         assert "No branches found." in captured.out
+        assert "Available branches:" not in captured.out
 
     @patch("builtins.input", side_effect=["q"])  # Quit
     def test_checkout_from_list_tags(
@@ -1,75 +1,74 @@
 """Tests for git-taz core functionality."""
 
+import sys
 from unittest.mock import patch
 
-from src.git_taz.core import main, parse_arguments
+import pytest
+
+from src.git_taz.core import _build_parser, main, parse_arguments
 
 
 class TestMain:
     """Test cases for the main function."""
 
     @patch("src.git_taz.ui.run_ui")
-    @patch("sys.argv", ["git-taz"])
-    def test_main_default(self, mock_run_ui):
+    def test_main_default(self, mock_run_ui, monkeypatch):
         """Test main function with default arguments."""
+        monkeypatch.setattr(sys, "argv", ["git-taz"])
         main()
         mock_run_ui.assert_called_once_with(None)
 
+    @patch("src.git_taz.core.parse_arguments")
     @patch("src.git_taz.ui.run_ui")
-    @patch("sys.argv", ["git-taz", "--repo", "/path/to/repo"])
-    def test_main_with_repo_path(self, mock_run_ui):
-        """Test main function with repository path."""
+    def test_main_default_skips_argument_parsing(
+        self, mock_run_ui, mock_parse_arguments, monkeypatch
+    ):
+        """Test that launching with no arguments bypasses argparse."""
+        monkeypatch.setattr(sys, "argv", ["git-taz"])
         main()
-        mock_run_ui.assert_called_once_with("/path/to/repo")
+        mock_run_ui.assert_called_once_with(None)
+        mock_parse_arguments.assert_not_called()
 
+    @pytest.mark.parametrize(
+        "repo, expected",
+        [("/path/to/repo", "/path/to/repo"), (".", None)],
+        ids=["repo-path", "current-directory"],
+    )
     @patch("src.git_taz.ui.run_ui")
-    @patch("sys.argv", ["git-taz", "--repo", "."])
-    def test_main_with_current_directory(self, mock_run_ui):
-        """Test main function with current directory as repo."""
+    def test_main_with_repo_option(self, mock_run_ui, repo, expected, monkeypatch):
+        """Test main function passes the repository path through to the UI."""
+        monkeypatch.setattr(sys, "argv", ["git-taz", "--repo", repo])
         main()
-        mock_run_ui.assert_called_once_with(None)
+        mock_run_ui.assert_called_once_with(expected)
 
 
 class TestParseArguments:
     """Test cases for the parse_arguments function."""
 
-    @patch("sys.argv", ["git-taz"])
-    def test_parse_default_arguments(self):
-        """Test parsing default arguments."""
+    @pytest.mark.parametrize(
+        "argv, expected_repo, expected_verbose",
+        [
+            (["git-taz"], ".", False),
+            (["git-taz", "--repo", "/path/to/repo"], "/path/to/repo", False),
+            (["git-taz", "-r", "/another/path"], "/another/path", False),
+            (["git-taz", "--verbose"], ".", True),
+            (["git-taz", "-v", "-r", "/test/path"], "/test/path", True),
+        ],
+        ids=["default", "repo", "repo-short", "verbose", "combined"],
+    )
+    def test_parse_global_arguments(
+        self, argv, expected_repo, expected_verbose, monkeypatch
+    ):
+        """Test parsing the repository and verbose options."""
+        monkeypatch.setattr(sys, "argv", argv)
         args = parse_arguments()
-        assert args.repo == "."
-        assert args.verbose is False
+        assert args.repo == expected_repo
+        assert args.verbose is expected_verbose
         assert args.command is None
 
-    @patch("sys.argv", ["git-taz", "--repo", "/path/to/repo"])
-    def test_parse_repo_argument(self):
-        """Test parsing repository argument."""
-        args = parse_arguments()
-        assert args.repo == "/path/to/repo"
-        assert args.verbose is False
-
-    @patch("sys.argv", ["git-taz", "-r", "/another/path"])
-    def test_parse_repo_short_argument(self):
-        """Test parsing repository short argument."""
-        args = parse_arguments()
-        assert args.repo == "/another/path"
-
-    @patch("sys.argv", ["git-taz", "--verbose"])
-    def test_parse_verbose_argument(self):
-        """Test parsing verbose argument."""
-        args = parse_arguments()
-        assert args.verbose is True
-
-    @patch("sys.argv", ["git-taz", "-v", "-r", "/test/path"])
-    def test_parse_combined_arguments(self):
-        """Test parsing combined arguments."""
-        args = parse_arguments()
-        assert args.repo == "/test/path"
-        assert args.verbose is True
-
-    @patch("sys.argv", ["git-taz", "checkout", "main"])
-    def test_parse_checkout_command(self):
+    def test_parse_checkout_command(self, monkeypatch):
         """Test parsing checkout command."""
+        monkeypatch.setattr(sys, "argv", ["git-taz", "checkout", "main"])
         args = parse_arguments()
         assert args.command == "checkout"
         assert args.target == "main"
@@ -77,82 +76,66 @@ class TestParseArguments:
         assert args.list_branches is False
         assert args.list_tags is False
 
-    @patch("sys.argv", ["git-taz", "checkout", "--interactive"])
-    def test_parse_checkout_interactive(self):
+    def test_parse_checkout_interactive(self, monkeypatch):
         """Test parsing checkout command with interactive flag."""
+        monkeypatch.setattr(sys, "argv", ["git-taz", "checkout", "--interactive"])
         args = parse_arguments()
         assert args.command == "checkout"
         assert args.interactive is True
 
-    @patch("sys.argv", ["git-taz", "checkout", "--list-branches"])
-    def test_parse_checkout_list_branches(self):
+    def test_parse_checkout_list_branches(self, monkeypatch):
         """Test parsing checkout command with list branches flag."""
+        monkeypatch.setattr(sys, "argv", ["git-taz", "checkout", "--list-branches"])
         args = parse_arguments()
         assert args.command == "checkout"
         assert args.list_branches is True
 
-    @patch("sys.argv", ["git-taz", "checkout", "--list-tags"])
-    def test_parse_checkout_list_tags(self):
+    def test_parse_checkout_list_tags(self, monkeypatch):
         """Test parsing checkout command with list tags flag."""
+        monkeypatch.setattr(sys, "argv", ["git-taz", "checkout", "--list-tags"])
         args = parse_arguments()
         assert args.command == "checkout"
         assert args.list_tags is True
 
+    def test_parser_is_built_once(self):
+        """Test that the argument parser is reused across calls."""
+        assert _build_parser() is _build_parser()
+
 
 class TestMainCLI:
     """Test cases for CLI command handling in main function."""
 
-    @patch("src.git_taz.cli.CheckoutCLI")
-    @patch("sys.argv", ["git-taz", "checkout", "--list-branches"])
-    def test_main_checkout_list_branches(self, mock_checkout_cli):
-        """Test main function with checkout list branches command."""
-        mock_cli_instance = mock_checkout_cli.return_value
-
-        main()
-
-        mock_checkout_cli.assert_called_once_with(None)
-        mock_cli_instance.list_branches.assert_called_once()
-
-    @patch("src.git_taz.cli.CheckoutCLI")
-    @patch("sys.argv", ["git-taz", "checkout", "--list-tags"])
-    def test_main_checkout_list_tags(self, mock_checkout_cli):
-        """Test main function with checkout list tags command."""
-        mock_cli_instance = mock_checkout_cli.return_value
-
-        main()
-
-        mock_checkout_cli.assert_called_once_with(None)
-        mock_cli_instance.list_tags.assert_called_once()
-
-    @patch("src.git_taz.cli.CheckoutCLI")
-    @patch("sys.argv", ["git-taz", "checkout", "--interactive"])
-    def test_main_checkout_interactive(self, mock_checkout_cli):
-        """Test main function with checkout interactive command."""
-        mock_cli_instance = mock_checkout_cli.return_value
-
-        main()
-
-        mock_checkout_cli.assert_called_once_with(None)
-        mock_cli_instance.checkout_interactive.assert_called_once()
-
-    @patch("src.git_taz.cli.CheckoutCLI")
-    @patch("sys.argv", ["git-taz", "checkout", "main"])
-    def test_main_checkout_direct(self, mock_checkout_cli):
-        """Test main function with direct checkout command."""
-        mock_cli_instance = mock_checkout_cli.return_value
-
-        main()
-
-        mock_checkout_cli.assert_called_once_with(None)
-        mock_cli_instance.checkout_direct.assert_called_once_with("main")
-
-    @patch("src.git_taz.cli.CheckoutCLI")
-    @patch("sys.argv", ["git-taz", "-r", "/path/to/repo", "checkout"])
-    def test_main_checkout_with_repo_path(self, mock_checkout_cli):
-        """Test main function with checkout command and repo path."""
-        mock_cli_instance = mock_checkout_cli.return_value
+    @pytest.fixture
+    def mock_checkout_cli(self):
+        """Patch the checkout CLI class that main() dispatches to."""
+        with patch("src.git_taz.cli.CheckoutCLI") as mock_checkout_cli:
+            yield mock_checkout_cli
+
+    @pytest.mark.parametrize(
+        "argv, expected_repo, method, method_args",
+        [
+            (["checkout", "--list-branches"], None, "list_branches", ()),
+            (["checkout", "--list-tags"], None, "list_tags", ()),
+            (["checkout", "--interactive"], None, "checkout_interactive", ()),
+            (["checkout", "main"], None, "checkout_direct", ("main",)),
+            (
+                ["-r", "/path/to/repo", "checkout"],
+                "/path/to/repo",
+                "checkout_interactive",
+                (),
+            ),
+        ],
+        ids=["list-branches", "list-tags", "interactive", "direct", "repo-path"],
+    )
+    def test_main_checkout(
+        self, mock_checkout_cli, monkeypatch, argv, expected_repo, method, method_args
+    ):
+        """Test main function dispatches checkout commands to the CLI."""
+        monkeypatch.setattr(sys, "argv", ["git-taz", *argv])
 
         main()
 
-        mock_checkout_cli.assert_called_once_with("/path/to/repo")
-        mock_cli_instance.checkout_interactive.assert_called_once()
+        mock_checkout_cli.assert_called_once_with(expected_repo)
+        getattr(mock_checkout_cli.return_value, method).assert_called_once_with(
+            *method_args
+        )
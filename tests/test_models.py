@@ -1,20 +1,38 @@
 """Tests for git-taz models."""
 
-import tempfile
 from pathlib import Path
+from unittest.mock import patch
+
+import git
+import pytest
 
 from src.git_taz.models import GitRepository, GitTool, ToolResult
 
+_CWD = Path(".").absolute()
+
 
 class TestGitRepository:
     """Test cases for the GitRepository class."""
 
+    @pytest.fixture(autouse=True)
+    def clear_repository_cache(self):
+        """Start every test without previously discovered repositories."""
+        GitRepository.clear_cache()
+        yield
+        GitRepository.clear_cache()
+
+    @pytest.fixture
+    def mock_repo_class(self):
+        """Patch git.Repo so tests can observe when a repo is opened."""
+        with patch("src.git_taz.models.git.Repo") as mock_repo_class:
+            yield mock_repo_class
+
     def test_from_path_existing_git_repo(self) -> None:
         """Test creating GitRepository from existing git repository."""
         # Assuming the project root is a git repository
         repo = GitRepository.from_path(".")
-        assert repo.absolute_path == str(Path(".").absolute())
-        assert repo.name == Path(".").absolute().name
+        assert repo.absolute_path == str(_CWD)
+        assert repo.name == _CWD.name
         assert repo.exists is True
         # This will be True if run from within a git repository
         assert isinstance(repo.is_git, bool)
@@ -27,19 +45,78 @@ class TestGitRepository:
         assert repo.exists is False
         assert repo.is_git is False
 
+    def test_from_path_nonexistent_path_skips_git(self, mock_repo_class) -> None:
+        """Test that a missing path is rejected without opening a repo."""
+        repo = GitRepository.from_path("/nonexistent/path")
+        mock_repo_class.assert_not_called()
+        assert repo.repo is None
+
     def test_from_path_with_relative_path(self) -> None:
         """Test creating GitRepository from relative path."""
         repo = GitRepository.from_path("./")
-        assert repo.absolute_path == str(Path("./").absolute())
+        assert repo.absolute_path == str(_CWD)
         assert repo.exists is True
 
-    def test_from_path_with_tempdir(self) -> None:
+    def test_from_path_is_cached(self) -> None:
+        """Test that repeated lookups of a path share one instance."""
+        first = GitRepository.from_path(".")
+        assert GitRepository.from_path(".") is first
+
+        GitRepository.clear_cache()
+        assert GitRepository.from_path(".") is not first
+
+    def test_from_path_rechecks_non_repository(self, tmp_path: Path) -> None:
+        """Test that a path found not to be a repository is probed again."""
+        assert GitRepository.from_path(str(tmp_path)).is_git is False
+
+        git.Repo.init(tmp_path)
+        repo = GitRepository.from_path(str(tmp_path))
+        assert repo.is_git is True
+        assert repo.repo is not None
+
+    def test_invalid_git_directory_is_not_a_repository(self, tmp_path: Path) -> None:
+        """Test that an empty .git directory is not treated as a repository."""
+        (tmp_path / ".git").mkdir()
+        repo = GitRepository.from_path(str(tmp_path))
+
+        assert repo.repo is None
+        assert repo.is_git is False
+        assert GitRepository.from_path(str(tmp_path)) is not repo
+
+    def test_from_path_opens_repo_lazily(self, mock_repo_class) -> None:
+        """Test that git.Repo is only created when repo is first accessed."""
+        repo = GitRepository.from_path(".")
+        mock_repo_class.assert_not_called()
+
+        assert repo.repo is mock_repo_class.return_value
+        assert repo.repo is mock_repo_class.return_value
+        mock_repo_class.assert_called_once_with(repo.absolute_path)
+
+    def test_repo_skips_optional_locks(self) -> None:
+        """Test that git commands run without optional locks or prompts."""
+        repo = GitRepository.from_path(".")
+        if not repo.is_git:
+            pytest.skip("not running inside a git repository")
+
+        environment = repo.repo.git.environment()
+        assert environment["GIT_OPTIONAL_LOCKS"] == "0"
+        assert environment["GIT_TERMINAL_PROMPT"] == "0"
+
+    def test_from_path_with_tempdir(self, tmp_path: Path) -> None:
         """Test creating GitRepository from temporary directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo = GitRepository.from_path(temp_dir)
-            assert repo.absolute_path == temp_dir
-            assert repo.exists is True
-            assert repo.is_git is False  # temp dir is not a git repo
+        repo = GitRepository.from_path(str(tmp_path))
+        assert repo.absolute_path == str(tmp_path)
+        assert repo.exists is True
+        assert repo.is_git is False  # temp dir is not a git repo
+
+    def test_from_path_plain_directory_skips_git(
+        self, tmp_path: Path, mock_repo_class
+    ) -> None:
+        """Test that a directory without a .git entry is not opened by git."""
+        repo = GitRepository.from_path(str(tmp_path))
+        mock_repo_class.assert_not_called()
+        assert repo.exists is True
+        assert repo.is_git is False
 
 
 class TestGitTool:
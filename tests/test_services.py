@@ -1,14 +1,34 @@
 """Tests for git-taz services module."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from git import Repo
+from unittest.mock import Mock, patch, MagicMock, PropertyMock
+from git import GitCommandError
 
 from src.git_taz.models import GitRepository
 from src.git_taz.services import GitOperationsService
 from src.git_taz.services.git_operations import CheckoutResult
 
 
+class _FakeRepo:
+    """Stand-in for git.Repo carrying only what the service reads."""
+
+    def __init__(self, git_dir):
+        self.common_dir = self.git_dir = git_dir
+        self.git = Mock()
+        self.config = {}
+
+    def config_reader(self, config_level=None):
+        return SimpleNamespace(
+            get_value=lambda section, option, default: self.config.get(
+                (section, option), default
+            )
+        )
+
+
 class TestCheckoutResult:
     """Test CheckoutResult class."""
 
@@ -31,10 +51,10 @@ class TestGitOperationsService:
     """Test GitOperationsService class."""
 
     @pytest.fixture
-    def mock_repository(self):
+    def mock_repository(self, tmp_path):
         """Create a mock repository."""
-        repo = Mock(spec=GitRepository)
-        repo.repo = Mock(spec=Repo)
+        repo = Mock(spec_set=GitRepository)
+        repo.repo = _FakeRepo(str(tmp_path))
         return repo
 
     @pytest.fixture
@@ -43,57 +63,105 @@ class TestGitOperationsService:
         with patch("src.git_taz.services.git_operations.GitToolsManager"):
             return GitOperationsService(mock_repository)
 
-    def test_get_branches_with_repo(self, service, mock_repository):
-        """Test getting branches when repository exists."""
-        # Mock branches
-        branch1 = Mock()
-        branch1.name = "main"
-        branch2 = Mock()
-        branch2.name = "feature/test"
+    @pytest.mark.parametrize(
+        "method, output, expected, namespace",
+        [
+            ("get_branches", "feature/test\nmain", ("feature/test", "main"), "heads"),
+            ("get_tags", "v1.0.0\nv2.0.0", ("v1.0.0", "v2.0.0"), "tags"),
+        ],
+        ids=["branches", "tags"],
+    )
+    def test_get_refs_with_repo(
+        self, service, mock_repository, method, output, expected, namespace
+    ):
+        """Test getting branches or tags when repository exists."""
+        mock_repository.repo.git = Mock()
+        mock_repository.repo.git.for_each_ref.return_value = output
+
+        assert getattr(service, method)() == expected
+        mock_repository.repo.git.for_each_ref.assert_called_once_with(
+            "--sort=refname", "--format=%(refname:lstrip=2)", f"refs/{namespace}"
+        )
+
+    def test_get_branches_git_error(self, service, mock_repository):
+        """Test getting branches when for-each-ref fails."""
+        mock_repository.repo.git = Mock()
+        mock_repository.repo.git.for_each_ref.side_effect = GitCommandError(
+            "for-each-ref", 128
+        )
 
-        mock_repository.repo.branches = [branch2, branch1]  # Unsorted order
+        assert service.get_branches() == ()
 
-        branches = service.get_branches()
-        assert branches == ["feature/test", "main"]  # Should be sorted
+    def test_get_branches_cached_until_checkout(self, service, mock_repository):
+        """Test that branches are read once and refreshed after checkout."""
+        mock_repository.repo.git = Mock()
+        mock_repository.repo.git.for_each_ref.side_effect = [
+            "main",
+            "develop\nmain",
+        ]
 
-    def test_get_branches_no_repo(self, service, mock_repository):
-        """Test getting branches when no repository."""
-        mock_repository.repo = None
-        branches = service.get_branches()
-        assert branches == []
+        assert service.get_branches() == ("main",)
+        assert service.get_branches() == ("main",)
+
+        service.checkout("develop")
+        assert service.get_branches() == ("develop", "main")
+
+    def test_get_branches_refreshed_when_refs_change(
+        self, service, mock_repository, tmp_path
+    ):
+        """Test that a new loose ref invalidates the cached branches."""
+        heads = tmp_path / "refs" / "heads"
+        heads.mkdir(parents=True)
+        mock_repository.repo.git = Mock()
+        mock_repository.repo.git.for_each_ref.side_effect = [
+            "main",
+            "develop\nmain",
+        ]
 
-    def test_get_tags_with_repo(self, service, mock_repository):
-        """Test getting tags when repository exists."""
-        # Mock tags
-        tag1 = Mock()
-        tag1.name = "v2.0.0"
-        tag2 = Mock()
-        tag2.name = "v1.0.0"
+        assert service.get_branches() == ("main",)
 
-        mock_repository.repo.tags = [tag1, tag2]  # Unsorted order
+        (heads / "develop").write_text("0" * 40)
+        os.utime(heads, ns=(0, 1))
 
-        tags = service.get_tags()
-        assert tags == ["v1.0.0", "v2.0.0"]  # Should be sorted
+        assert service.get_branches() == ("develop", "main")
 
-    def test_get_tags_no_repo(self, service, mock_repository):
-        """Test getting tags when no repository."""
+    def test_get_branches_not_cached_with_reftable(self, service, mock_repository):
+        """Test that refs are listed every time when stored in reftable."""
+        mock_repository.repo.config[("extensions", "refStorage")] = "reftable"
+        mock_repository.repo.git.for_each_ref.side_effect = ["main", "develop\nmain"]
+
+        assert service.get_branches() == ("main",)
+        assert service.get_branches() == ("develop", "main")
+
+    @pytest.mark.parametrize("method", ["get_branches", "get_tags"])
+    def test_get_refs_no_repo(self, service, mock_repository, method):
+        """Test getting branches or tags when no repository."""
         mock_repository.repo = None
-        tags = service.get_tags()
-        assert tags == []
-
-    def test_get_checkout_targets_branches(self, service):
-        """Test getting checkout targets for branches."""
-        with patch.object(service, "get_branches", return_value=["main", "develop"]):
-            targets = service.get_checkout_targets("branches")
-            expected = [("main", "main"), ("develop", "develop")]
-            assert targets == expected
-
-    def test_get_checkout_targets_tags(self, service):
-        """Test getting checkout targets for tags."""
-        with patch.object(service, "get_tags", return_value=["v1.0.0", "v2.0.0"]):
-            targets = service.get_checkout_targets("tags")
-            expected = [("v1.0.0", "v1.0.0"), ("v2.0.0", "v2.0.0")]
-            assert targets == expected
+        assert getattr(service, method)() == ()
+
+    @pytest.mark.parametrize(
+        "target_type, method, names",
+        [
+            ("branches", "get_branches", ["main", "develop"]),
+            ("tags", "get_tags", ["v1.0.0", "v2.0.0"]),
+        ],
+        ids=["branches", "tags"],
+    )
+    def test_get_checkout_targets(self, service, target_type, method, names):
+        """Test getting checkout targets for branches or tags."""
+        with patch.object(service, method, return_value=names):
+            targets = service.get_checkout_targets(target_type)
+        assert targets == tuple((name, name) for name in names)
+
+    def test_get_checkout_targets_reused_for_same_names(self, service):
+        """Test that target pairs are only rebuilt when the names change."""
+        names = ["main", "develop"]
+        with patch.object(service, "get_branches", return_value=names):
+            first = service.get_checkout_targets("branches")
+            assert service.get_checkout_targets("branches") is first
+
+        with patch.object(service, "get_branches", return_value=["main"]):
+            assert service.get_checkout_targets("branches") == (("main", "main"),)
 
     def test_checkout_success(self, service, mock_repository):
         """Test successful checkout."""
@@ -129,13 +197,30 @@ class TestGitOperationsService:
 
     def test_get_current_branch_success(self, service, mock_repository):
         """Test getting current branch successfully."""
-        mock_branch = Mock()
-        mock_branch.name = "main"
+        mock_branch = SimpleNamespace(name="main")
         mock_repository.repo.active_branch = mock_branch
 
         branch = service.get_current_branch()
         assert branch == "main"
 
+    def test_get_current_branch_cached_until_head_changes(
+        self, service, mock_repository, tmp_path
+    ):
+        """Test that the current branch is re-read only after HEAD changes."""
+        head = tmp_path / "HEAD"
+        head.write_text("ref: refs/heads/main\n")
+        os.utime(head, ns=(0, 1))
+        mock_branch = SimpleNamespace(name="main")
+        mock_repository.repo.active_branch = mock_branch
+
+        assert service.get_current_branch() == "main"
+
+        mock_branch.name = "develop"
+        assert service.get_current_branch() == "main"
+
+        os.utime(head, ns=(0, 2))
+        assert service.get_current_branch() == "develop"
+
     def test_get_current_branch_no_repo(self, service, mock_repository):
         """Test getting current branch when no repository."""
         mock_repository.repo = None
@@ -143,11 +228,14 @@ class TestGitOperationsService:
         branch = service.get_current_branch()
         assert branch is None
 
-    def test_get_current_branch_failure(self, service, mock_repository):
+    def test_get_current_branch_failure(self, service, monkeypatch):
         """Test getting current branch when git fails."""
         # Mock the active_branch property to raise an exception when accessed
-        type(mock_repository.repo).active_branch = property(
-            lambda x: (_ for _ in ()).throw(Exception("No active branch"))
+        monkeypatch.setattr(
+            _FakeRepo,
+            "active_branch",
+            PropertyMock(side_effect=Exception("No active branch")),
+            raising=False,
         )
 
         branch = service.get_current_branch()
@@ -155,18 +243,55 @@ class TestGitOperationsService:
 
     def test_git_operations_delegation(self, service):
         """Test that git operations are properly delegated to tools manager."""
-        # Test that the service delegates to tools manager
-        service.tools_manager.git_status.return_value = "status_result"
-        service.tools_manager.git_log.return_value = "log_result"
-        service.tools_manager.git_branches.return_value = "branches_result"
-        service.tools_manager.git_diff.return_value = "diff_result"
+        tools = service.tools_manager
+        tools.git_status.return_value = "status_result"
+        tools.git_log.return_value = "log_result"
+        tools.git_branches.return_value = "branches_result"
+        tools.git_diff.return_value = "diff_result"
 
         assert service.get_status() == "status_result"
         assert service.get_log() == "log_result"
         assert service.get_branches_info() == "branches_result"
         assert service.get_diff() == "diff_result"
 
-        service.tools_manager.git_status.assert_called_once()
-        service.tools_manager.git_log.assert_called_once()
-        service.tools_manager.git_branches.assert_called_once()
-        service.tools_manager.git_diff.assert_called_once()
+        tools.git_status.assert_called_once()
+        tools.git_log.assert_called_once()
+        tools.git_branches.assert_called_once()
+        tools.git_diff.assert_called_once()
+
+    def test_tools_run_from_worker_threads(self, service):
+        """Test that tools can run concurrently, as the UI's worker threads do."""
+        service.tools_manager.git_log.return_value = "log_result"
+        service.tools_manager.git_branches.return_value = "branches_result"
+        getters = [service.get_log, service.get_branches_info] * 8
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda get: get(), getters))
+
+        assert results == ["log_result", "branches_result"] * 8
+
+    def test_get_log_cached_until_refs_change(self, service, tmp_path):
+        """Test that the log is re-run only after a branch ref moves."""
+        heads = tmp_path / "refs" / "heads"
+        heads.mkdir(parents=True)
+        service.tools_manager.git_log.side_effect = ["first", "second"]
+
+        assert service.get_log() == "first"
+        assert service.get_log() == "first"
+
+        (heads / "main").write_text("0" * 40)
+        os.utime(heads, ns=(0, 1))
+
+        assert service.get_log() == "second"
+        assert service.tools_manager.git_log.call_count == 2
+
+    def test_shared_tools_manager(self, mock_repository):
+        """Test that a provided tools manager is reused instead of rebuilt."""
+        tools_manager = Mock()
+        with patch(
+            "src.git_taz.services.git_operations.GitToolsManager"
+        ) as mock_tools_class:
+            service = GitOperationsService(mock_repository, tools_manager)
+
+        mock_tools_class.assert_not_called()
+        assert service.tools_manager is tools_manager
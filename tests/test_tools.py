@@ -0,0 +1,131 @@
+"""Tests for git-taz tools module."""
+
+import os
+from pathlib import Path
+from typing import Iterator
+
+import git
+import pytest
+
+from src.git_taz.models import GitRepository
+from src.git_taz.tools import GitToolsManager
+
+
+class TestGitToolsManager:
+    """Test cases for GitToolsManager against real repositories."""
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> git.Repo:
+        """Create a repository with one committed file."""
+        repo = git.Repo.init(tmp_path)
+        with repo.config_writer() as config:
+            config.set_value("user", "name", "Test")
+            config.set_value("user", "email", "test@example.com")
+        (tmp_path / "old.txt").write_text("tracked\n")
+        repo.git.add("old.txt")
+        repo.git.commit("-m", "Initial commit")
+        return repo
+
+    @pytest.fixture
+    def tools(self, repo: git.Repo) -> Iterator[GitToolsManager]:
+        """Create a tools manager for the test repository."""
+        GitRepository.clear_cache()
+        yield GitToolsManager(GitRepository.from_path(repo.working_dir))
+        GitRepository.clear_cache()
+
+    def test_status_staged_rename(self, repo, tools) -> None:
+        """Test that a staged rename is listed once, under its new path."""
+        repo.git.mv("old.txt", "new.txt")
+
+        result = tools.git_status()
+
+        assert result.success is True
+        assert result.output == "M  new.txt"
+
+    def test_status_unmerged_path(self, repo, tools) -> None:
+        """Test that a conflicted path shows as both staged and unstaged."""
+        work_tree = Path(repo.working_dir)
+        base = repo.active_branch.name
+        repo.git.checkout("-b", "other")
+        (work_tree / "old.txt").write_text("other\n")
+        repo.git.commit("-am", "Other change")
+        repo.git.checkout(base)
+        (work_tree / "old.txt").write_text("base\n")
+        repo.git.commit("-am", "Base change")
+        with pytest.raises(git.GitCommandError):
+            repo.git.merge("other")
+
+        result = tools.git_status()
+
+        assert result.success is True
+        assert result.output == " M old.txt\nM  old.txt"
+
+    def test_status_untracked_file(self, repo, tools) -> None:
+        """Test that untracked files are listed with the ?? marker."""
+        (Path(repo.working_dir) / "notes.txt").write_text("draft\n")
+
+        result = tools.git_status()
+
+        assert result.success is True
+        assert result.output == "?? notes.txt"
+
+    def test_status_non_utf8_filename(self, repo, tools) -> None:
+        """Test that a filename that is not valid UTF-8 does not break status."""
+        name = os.fsdecode(b"caf\xe9.txt")
+        (Path(repo.working_dir) / name).write_text("data\n")
+
+        result = tools.git_status()
+
+        assert result.success is True
+        assert result.output == "?? caf\ufffd.txt"
+
+    def test_status_clean(self, tools) -> None:
+        """Test status of a repository without changes."""
+        result = tools.git_status()
+
+        assert result.success is True
+        assert result.output == "No changes"
+
+    def test_diff_staged_delete(self, repo, tools) -> None:
+        """Test that a staged delete is reported as deleted, not added."""
+        repo.git.rm("old.txt")
+
+        result = tools.git_diff(staged=True)
+
+        assert result.success is True
+        assert result.output == "diff --git a/old.txt b/old.txt\nDeleted: old.txt"
+
+    def test_diff_staged_rename(self, repo, tools) -> None:
+        """Test that a staged rename keeps the old path first."""
+        repo.git.mv("old.txt", "new.txt")
+
+        result = tools.git_diff(staged=True)
+
+        assert result.success is True
+        assert result.output == "diff --git a/old.txt b/new.txt"
+
+    def test_diff_unstaged_modification(self, repo, tools) -> None:
+        """Test that work tree changes are diffed against the index."""
+        (Path(repo.working_dir) / "old.txt").write_text("changed\n")
+
+        assert tools.git_diff(staged=True).output == "No differences"
+        assert tools.git_diff().output == (
+            "diff --git a/old.txt b/old.txt\nModified: old.txt"
+        )
+
+    def test_log_first_line_of_each_message(self, repo, tools) -> None:
+        """Test that log shows each message's first line, capped at 80 chars."""
+        long_subject = "x" * 100
+        repo.git.commit("--allow-empty", "-m", "Subject line\n\nBody text\nmore")
+        repo.git.commit("--allow-empty", "-m", long_subject)
+        repo.git.commit("--allow-empty", "--allow-empty-message", "-m", "")
+        shas = repo.git.log("--format=%h", "--abbrev=7").splitlines()
+
+        result = tools.git_log()
+
+        assert result.success is True
+        lines = result.output.split("\n")
+        assert len(lines) == 4
+        messages = ["", long_subject[:80], "Subject line", "Initial commit"]
+        for line, sha, message in zip(lines, shas, messages):
+            assert line[17:] == f"{'Test':<22} {sha} {message}"